@@ -132,6 +132,9 @@ hiddenimports += [
     "typer.rich_utils",
     "click.termui",
     "click.decorators",
+    # Subcommand groups are imported by name (see dbops.cli.cli._LAZY_SUBCOMMANDS).
+    "dbops.cli.commands.jobs",
+    "dbops.cli.commands.unitycatalog",
 ]
 
 hiddenimports = sorted(set(hiddenimports))
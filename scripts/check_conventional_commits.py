@@ -8,17 +8,66 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import subprocess
 from pathlib import Path
 
-CONVENTIONAL_RE = re.compile(
-    r"^(feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(\([\w\-./]+\))?(!)?: .+"
+MAX_COMMITS = 500
+
+COMMIT_TYPES = frozenset(
+    {
+        "feat",
+        "fix",
+        "docs",
+        "style",
+        "refactor",
+        "perf",
+        "test",
+        "build",
+        "ci",
+        "chore",
+        "revert",
+    }
 )
-
-
-def _run(*args: str) -> str:
-    return subprocess.check_output(args, text=True).strip()
+_TYPE_INITIALS = frozenset(t[0] for t in COMMIT_TYPES)
+_SCOPE_PUNCTUATION = frozenset("_-./")
+
+
+def _read_records(stream, *, sep: str = "\0", chunk_size: int = 65536):
+    """Yield `sep`-terminated records from a text stream without buffering it all."""
+    pending = ""
+    while chunk := stream.read(chunk_size):
+        pending += chunk
+        *records, pending = pending.split(sep)
+        yield from records
+    if pending:
+        yield pending
+
+
+def _invalid_subjects(commit_range: str) -> tuple[list[str], int]:
+    """Stream commit subjects from git log.
+
+    Returns:
+        The invalid subjects and the number of commits read.
+    """
+    cmd = [
+        "git",
+        "log",
+        "-z",
+        "--format=%s",
+        f"--max-count={MAX_COMMITS}",
+        commit_range,
+    ]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True) as proc:
+        assert proc.stdout is not None
+        invalid = []
+        checked = 0
+        for subject in _read_records(proc.stdout):
+            checked += 1
+            if subject and not _is_valid(subject):
+                invalid.append(subject)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return invalid, checked
 
 
 def _commit_range() -> str:
@@ -31,8 +80,7 @@ def _commit_range() -> str:
 
     event_path = os.getenv("GITHUB_EVENT_PATH")
     if event_path and Path(event_path).exists():
-        with open(event_path, "r", encoding="utf-8") as handle:
-            event = json.load(handle)
+        event = json.loads(Path(event_path).read_bytes())
         before = event.get("before")
         after = event.get("after")
         if before and after:
@@ -41,24 +89,49 @@ def _commit_range() -> str:
     return "HEAD~20..HEAD"
 
 
+def _is_conventional(subject: str) -> bool:
+    """Return True if subject matches `type(scope)!: description`."""
+    if not subject or subject[0] not in _TYPE_INITIALS:
+        return False
+    idx = subject.find(": ")
+    if idx <= 0 or idx + 2 >= len(subject):
+        return False
+    head = subject[:idx]
+    head = head.removesuffix("!")
+    if head.endswith(")"):
+        scope_start = head.find("(")
+        if scope_start == -1:
+            return False
+        scope = head[scope_start + 1 : -1]
+        if not scope or not all(c.isalnum() or c in _SCOPE_PUNCTUATION for c in scope):
+            return False
+        head = head[:scope_start]
+    return head in COMMIT_TYPES
+
+
 def _is_valid(subject: str) -> bool:
     if subject.startswith("Merge "):
         return True
     if subject.startswith("Revert "):
         return True
-    return bool(CONVENTIONAL_RE.match(subject))
+    return _is_conventional(subject)
 
 
 def main() -> int:
     commit_range = _commit_range()
     try:
-        subjects = _run("git", "log", "--format=%s", commit_range).splitlines()
+        invalid, checked = _invalid_subjects(commit_range)
     except subprocess.CalledProcessError as exc:
         print(f"Failed to read commits for range: {commit_range}")
         print(exc)
         return 2
 
-    invalid = [s for s in subjects if not _is_valid(s)]
+    if checked >= MAX_COMMITS:
+        print(
+            f"Warning: only the newest {MAX_COMMITS} commits in {commit_range} "
+            "were checked; older commits were skipped."
+        )
+
     if not invalid:
         print("Conventional Commit check passed.")
         return 0
@@ -1,20 +1,79 @@
 """CLI application for Databricks operations tooling."""
 
+from __future__ import annotations
+
+import importlib
+
 import typer
+from typer.core import TyperGroup
+from typer.main import get_group_from_info
+from typer.models import TyperInfo
 
-from dbops.cli.commands.jobs import app as jobs_app
-from dbops.cli.commands.unitycatalog import uc_app
 from dbops.cli.common.banner import opt_print_banner
 
+# Subcommand groups, imported only when invoked: name -> (module:attr, help).
+# Keeps `dbops --help` from loading the Databricks SDK and prompt toolkit.
+_LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "jobs": (
+        "dbops.cli.commands.jobs:app",
+        "Search / start / monitor Databricks jobs.",
+    ),
+    "uc": (
+        "dbops.cli.commands.unitycatalog:uc_app",
+        "Search / manage Unity Catalog objects.",
+    ),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx) -> list[str]:
+        """Return eager commands followed by the lazily loaded groups."""
+        names = super().list_commands(ctx)
+        return names + [n for n in _LAZY_SUBCOMMANDS if n not in self.commands]
+
+    def get_command(self, ctx, cmd_name: str):
+        """Return a loaded command, or a help-only stand-in for a lazy group."""
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in _LAZY_SUBCOMMANDS:
+            return cmd
+        # Listing commands (help, completion) only needs the name and help.
+        return TyperGroup(name=cmd_name, help=_LAZY_SUBCOMMANDS[cmd_name][1])
+
+    def resolve_command(self, ctx, args: list[str]):
+        """Import the invoked subcommand group before resolving it."""
+        if args and args[0] in _LAZY_SUBCOMMANDS and args[0] not in self.commands:
+            self.add_command(_load_group(args[0]))
+        return super().resolve_command(ctx, args)
+
+
+def _load_group(name: str) -> TyperGroup:
+    """Import a lazy subcommand's Typer app and build its click group."""
+    target, help_text = _LAZY_SUBCOMMANDS[name]
+    module_name, _, attr = target.partition(":")
+    sub_app: typer.Typer = getattr(importlib.import_module(module_name), attr)
+    # Same construction as `app.add_typer(sub_app, name=..., help=...)`.
+    return get_group_from_info(
+        TyperInfo(sub_app, name=name, help=help_text),
+        pretty_exceptions_short=sub_app.pretty_exceptions_short,
+        suggest_commands=sub_app.suggest_commands,
+        rich_markup_mode=sub_app.rich_markup_mode,
+    )
+
+
 opt_print_banner()
 
 app = typer.Typer(
+    cls=LazyTyperGroup,
     help="Databricks operations tooling",
     no_args_is_help=True,
 )
 
-app.add_typer(jobs_app, name="jobs", help="Search / start / monitor Databricks jobs.")
-app.add_typer(uc_app, name="uc", help="Search / manage Unity Catalog objects.")
+
+@app.callback()
+def _main() -> None:
+    """Databricks operations tooling."""
 
 
 if __name__ == "__main__":
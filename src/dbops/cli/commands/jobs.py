@@ -12,6 +12,7 @@ from dbops.cli.common.exits import die, ok_exit, warn_exit
 from dbops.cli.common.options import (
     ConfirmOpt,
     DryRunOpt,
+    LimitOpt,
     NameOpt,
     ParallelOpt,
     ProfileOpt,
@@ -38,16 +39,16 @@ def _init(
     refresh: bool = RefreshOpt,
 ):
     """Initialize jobs context (use --refresh alone to refresh cache)."""
-    # Build shared context (client + adapter) once per invocation
+    if ctx.invoked_subcommand is None and not refresh:
+        typer.echo(ctx.get_help())
+        raise typer.Exit(0)
+    # Build shared context once per invocation; the client is created lazily
     ctx.obj = build_jobs_context(profile, refresh_jobs=refresh)
     if refresh and ctx.invoked_subcommand is None:
         appctx: JobsAppContext = ctx.obj
         with out.status("Refreshing jobs cache..."):
             appctx.adapter.find_all_jobs()
         ok_exit("Jobs cache refreshed")
-    if ctx.invoked_subcommand is None:
-        typer.echo(ctx.get_help())
-        raise typer.Exit(0)
 
 
 @app.command()
@@ -56,6 +57,7 @@ def find(
     name: str | None = NameOpt,
     tag: list[str] = TagOpt,
     use_or: bool = UseOrOpt,
+    limit: int | None = LimitOpt,
 ):
     """
     Find jobs using selectors.
@@ -68,7 +70,7 @@ def find(
         die(str(e), code=1)
 
     with out.status("Loading jobs..."):
-        jobs = core_select_jobs(appctx.adapter, selector)
+        jobs = core_select_jobs(appctx.adapter, selector, limit=limit)
 
     if not jobs:
         warn_exit("No jobs found", code=0)
@@ -131,6 +133,7 @@ def run(
             runs,
             poll_interval=5,
             job_name_by_id=job_name_by_id,
+            max_parallel=parallel,
         )
 
         out.run_status_table(
@@ -3,7 +3,6 @@ from __future__ import annotations
 import re
 
 import typer
-from databricks.sdk.errors import NotFound, PermissionDenied
 
 from dbops.core.catalog import (
     delete_schema_with_tables,
@@ -13,9 +12,19 @@ from dbops.core.catalog import (
     parse_schema_full_name,
     set_tables_owner,
 )
+from dbops.core.patterns import compile_pattern, matcher
 from dbops.cli.common.context import UCAppContext, build_uc_context
 from dbops.cli.common.exits import exit_from_exc
-from dbops.cli.common.options import ProfileOpt
+from dbops.cli.common.options import (
+    CatalogOpt,
+    PreviewOpt,
+    ProfileOpt,
+    SchemaArg,
+    SchemaOpt,
+    TableNameOpt,
+    TablesParallelOpt,
+    YesOpt,
+)
 from dbops.cli.common.output import out
 
 uc_app = typer.Typer(
@@ -28,10 +37,10 @@ uc_app = typer.Typer(
 @uc_app.callback()
 def _init(ctx: typer.Context, profile: str | None = ProfileOpt):
     """Initialize Unity Catalog context."""
-    ctx.obj = build_uc_context(profile)
     if ctx.invoked_subcommand is None:
         typer.echo(ctx.get_help())
         raise typer.Exit(0)
+    ctx.obj = build_uc_context(profile)
 
 
 def _parse_schema_or_exit(schema_full_name: str) -> tuple[str, str, str]:
@@ -57,12 +66,23 @@ def _resolve_schema_or_exit(
     return _parse_schema_or_exit(schema_full_name)
 
 
+def _matched_title(preview: int, total: int) -> str:
+    """Title for a matched-tables preview that may be truncated by --preview."""
+    if preview < total:
+        return f"Matched tables (first {preview} of {total})"
+    return "Matched tables"
+
+
 def _compile_regex_or_exit(pattern: str | None, *, option_name: str) -> re.Pattern | None:
-    """Compile a regex pattern and convert invalid syntax into CLI input errors."""
+    """Compile a regex pattern and convert invalid syntax into CLI input errors.
+
+    Unity Catalog names are SQL identifiers, so patterns are compiled with
+    `re.ASCII`: `\\w`, `\\d` and `\\s` match ASCII characters only.
+    """
     if not pattern:
         return None
     try:
-        return re.compile(pattern)
+        return compile_pattern(pattern, re.ASCII)
     except re.error as exc:
         out.error(f"Invalid regex for {option_name}: {exc}")
         raise typer.Exit(2) from exc
@@ -71,6 +91,8 @@ def _compile_regex_or_exit(pattern: str | None, *, option_name: str) -> re.Patte
 @uc_app.command("catalogs-list")
 def catalogs_list(ctx: typer.Context):
     """List Unity Catalog catalogs."""
+    from databricks.sdk.errors import PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
 
@@ -92,32 +114,34 @@ def catalogs_list(ctx: typer.Context):
 @uc_app.command("schemas-list")
 def schemas_list(
     ctx: typer.Context,
-    catalog: str = typer.Option(..., "--catalog", help="Catalog name"),
+    catalog: str = CatalogOpt,
     name: str | None = typer.Option(
         None, "--name", help="Regex filter for schema full names"
     ),
     owner: str | None = typer.Option(None, "--owner", help="Filter by schema owner"),
 ):
     """List Unity Catalog schemas in a catalog."""
+    from databricks.sdk.errors import NotFound, PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
     name_rx = _compile_regex_or_exit(name, option_name="--name")
+    search = matcher(name_rx) if name_rx else None
+    want_owner = owner.casefold() if owner else None
 
     try:
         with out.status("Loading schemas..."):
-            schemas = adapter.list_schemas(catalog=catalog)
+            schemas = [
+                s
+                for s in adapter.iter_schemas(catalog=catalog)
+                if (search is None or search(s.full_name))
+                and (want_owner is None or (s.owner or "").casefold() == want_owner)
+            ]
     except NotFound as exc:
         exit_from_exc(exc, message=f"Catalog '{catalog}' does not exist.", code=1)
     except PermissionDenied as exc:
         exit_from_exc(exc, message=f"No permission to access catalog '{catalog}'.", code=1)
 
-    if name_rx:
-        schemas = [s for s in schemas if name_rx.search(s.full_name)]
-
-    if owner:
-        want_owner = owner.lower()
-        schemas = [s for s in schemas if (s.owner or "").lower() == want_owner]
-
     if not schemas:
         out.warn("No schemas found.")
         raise typer.Exit(0)
@@ -130,15 +154,9 @@ def schemas_list(
 @uc_app.command("tables-list")
 def tables_list(
     ctx: typer.Context,
-    schema_arg: str | None = typer.Argument(
-        None, help="Schema in the form catalog.schema"
-    ),
-    schema: str | None = typer.Option(
-        None, "--schema", help="Schema in the form catalog.schema"
-    ),
-    name: str | None = typer.Option(
-        None, "--name", help="Regex filter for table full names"
-    ),
+    schema_arg: str | None = SchemaArg,
+    schema: str | None = SchemaOpt,
+    name: str | None = TableNameOpt,
     owner: str | None = typer.Option(None, "--owner", help="Filter by table owner"),
     type_: str | None = typer.Option(
         None,
@@ -147,6 +165,8 @@ def tables_list(
     ),
 ):
     """List Unity Catalog tables in a schema."""
+    from databricks.sdk.errors import NotFound, PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
     schema_full_name, catalog, schema_name = _resolve_schema_or_exit(
@@ -154,10 +174,19 @@ def tables_list(
         schema_opt=schema,
     )
     name_rx = _compile_regex_or_exit(name, option_name="--name")
+    search = matcher(name_rx) if name_rx else None
+    want_owner = owner.casefold() if owner else None
+    want_type = type_.casefold() if type_ else None
 
     try:
         with out.status("Loading tables..."):
-            tables = adapter.list_tables(catalog=catalog, schema=schema_name)
+            tables = [
+                t
+                for t in adapter.iter_tables(catalog=catalog, schema=schema_name)
+                if (search is None or search(t.full_name))
+                and (want_owner is None or (t.owner or "").casefold() == want_owner)
+                and (want_type is None or (t.table_type or "").casefold() == want_type)
+            ]
     except NotFound as exc:
         exit_from_exc(
             exc, message=f"Schema '{schema_full_name}' does not exist.", code=1
@@ -167,16 +196,6 @@ def tables_list(
             exc, message=f"No permission to access schema '{schema_full_name}'.", code=1
         )
 
-    if name_rx:
-        tables = [t for t in tables if name_rx.search(t.full_name)]
-
-    if owner:
-        tables = [t for t in tables if (t.owner or "").lower() == owner.lower()]
-
-    if type_:
-        want = type_.lower()
-        tables = [t for t in tables if (t.table_type or "").lower() == want]
-
     if not tables:
         out.warn("No tables found.")
         raise typer.Exit(0)
@@ -189,27 +208,25 @@ def tables_list(
 @uc_app.command("tables-owner-set")
 def tables_owner_set(
     ctx: typer.Context,
-    schema_arg: str | None = typer.Argument(
-        None, help="Schema in the form catalog.schema"
-    ),
-    schema: str | None = typer.Option(
-        None, "--schema", help="Schema in the form catalog.schema"
-    ),
-    name: str | None = typer.Option(
-        None, "--name", help="Regex filter for table full names"
-    ),
+    schema_arg: str | None = SchemaArg,
+    schema: str | None = SchemaOpt,
+    name: str | None = TableNameOpt,
     owner: str = typer.Option(
         ..., "--owner", help="New table owner (user or service principal)"
     ),
     all_: bool = typer.Option(
         False, "--all", help="Change owner for all matched tables without selection UI"
     ),
+    parallel: int = TablesParallelOpt,
+    preview: int = PreviewOpt,
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would change, but do nothing"
     ),
-    yes: bool = typer.Option(False, "--yes", help="Skip confirmation prompt"),
+    yes: bool = YesOpt,
 ):
     """Set the owner for one or more Unity Catalog tables."""
+    from databricks.sdk.errors import NotFound, PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
     schema_full_name, catalog, schema_name = _resolve_schema_or_exit(
@@ -217,9 +234,14 @@ def tables_owner_set(
         schema_opt=schema,
     )
     name_rx = _compile_regex_or_exit(name, option_name="--name")
+    search = matcher(name_rx) if name_rx else None
     try:
         with out.status("Loading tables..."):
-            tables = adapter.list_tables(catalog=catalog, schema=schema_name)
+            tables = [
+                t
+                for t in adapter.iter_tables(catalog=catalog, schema=schema_name)
+                if search is None or search(t.full_name)
+            ]
     except NotFound as exc:
         exit_from_exc(
             exc, message=f"Schema '{schema_full_name}' does not exist.", code=1
@@ -229,22 +251,18 @@ def tables_owner_set(
             exc, message=f"No permission to access schema '{schema_full_name}'.", code=1
         )
 
-    if name_rx:
-        tables = [t for t in tables if name_rx.search(t.full_name)]
-
     if not tables:
         out.warn("No tables found.")
         raise typer.Exit(0)
 
     full_names = [t.full_name for t in tables]
-    out.header("Matched tables")
-    out.tables_table(tables, title="Matched tables")
-
-    selected = (
-        full_names
-        if all_
-        else out.select_many("Select tables to change owner:", full_names)
-    )
+    if all_:
+        # Everything matched is selected; the "Selected tables" render covers it.
+        selected = full_names
+    else:
+        out.header("Matched tables")
+        out.tables_table(tables[:preview], title=_matched_title(preview, len(tables)))
+        selected = out.select_many("Select tables to change owner:", full_names)
     if not selected:
         out.warn("No tables selected.")
         raise typer.Exit(0)
@@ -266,10 +284,12 @@ def tables_owner_set(
             raise typer.Exit(0)
 
     with out.status("Updating table owners..."):
-        results = set_tables_owner(adapter, selected, owner, dry_run=False)
+        results = set_tables_owner(
+            adapter, selected, owner, dry_run=False, max_parallel=parallel
+        )
     out.uc_owner_change_results_table(results, title="Owner change results")
 
-    failed = [r for r in results if not getattr(r, "ok", False)]
+    failed = [r for r in results if not r.ok]
     if failed:
         out.error(f"Failed to change owner for {len(failed)} table(s).")
         raise typer.Exit(1)
@@ -280,24 +300,22 @@ def tables_owner_set(
 @uc_app.command("tables-delete")
 def tables_delete(
     ctx: typer.Context,
-    schema_arg: str | None = typer.Argument(
-        None, help="Schema in the form catalog.schema"
-    ),
-    schema: str | None = typer.Option(
-        None, "--schema", help="Schema in the form catalog.schema"
-    ),
-    name: str | None = typer.Option(
-        None, "--name", help="Regex filter for table full names"
-    ),
+    schema_arg: str | None = SchemaArg,
+    schema: str | None = SchemaOpt,
+    name: str | None = TableNameOpt,
     all_: bool = typer.Option(
         False, "--all", help="Delete all matched tables without selection UI"
     ),
+    parallel: int = TablesParallelOpt,
+    preview: int = PreviewOpt,
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would be deleted, but do nothing"
     ),
-    yes: bool = typer.Option(False, "--yes", help="Skip confirmation prompt"),
+    yes: bool = YesOpt,
 ):
     """Delete one or more Unity Catalog tables (owner -> delete)."""
+    from databricks.sdk.errors import NotFound, PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
     schema_full_name, catalog, schema_name = _resolve_schema_or_exit(
@@ -305,9 +323,18 @@ def tables_delete(
         schema_opt=schema,
     )
     name_rx = _compile_regex_or_exit(name, option_name="--name")
+    search = matcher(name_rx) if name_rx else None
     try:
         with out.status("Loading tables..."):
-            tables = adapter.list_tables(catalog=catalog, schema=schema_name)
+            # dict.fromkeys drops names repeated across listing pages (keeping
+            # order) so a table is never offered or deleted twice.
+            full_names = list(
+                dict.fromkeys(
+                    t.full_name
+                    for t in adapter.iter_tables(catalog=catalog, schema=schema_name)
+                    if search is None or search(t.full_name)
+                )
+            )
     except NotFound as exc:
         exit_from_exc(
             exc, message=f"Schema '{catalog}.{schema_name}' does not exist.", code=1
@@ -319,21 +346,19 @@ def tables_delete(
             code=1,
         )
 
-    full_names = [t.full_name for t in tables]
-
-    if name_rx:
-        full_names = [n for n in full_names if name_rx.search(n)]
-
     if not full_names:
         out.warn("No tables found.")
         raise typer.Exit(0)
 
-    out.header("Matched tables")
-    out.tables_table(full_names, title="Matched tables")
-
-    selected = (
-        full_names if all_ else out.select_many("Select tables to delete:", full_names)
-    )
+    if all_:
+        # Everything matched is selected; the "Selected tables" render covers it.
+        selected = full_names
+    else:
+        out.header("Matched tables")
+        out.tables_table(
+            full_names[:preview], title=_matched_title(preview, len(full_names))
+        )
+        selected = out.select_many("Select tables to delete:", full_names)
 
     if not selected:
         out.warn("No tables selected.")
@@ -353,11 +378,13 @@ def tables_delete(
 
     status_msg = "Planning table deletions..." if dry_run else "Deleting tables..."
     with out.status(status_msg):
-        results = delete_tables(adapter, selected, dry_run=dry_run)
+        results = delete_tables(
+            adapter, selected, dry_run=dry_run, max_parallel=parallel
+        )
 
     out.uc_delete_results_table(results, title="Delete results")
 
-    failed = [r for r in results if getattr(r, "error", None)]
+    failed = [r for r in results if r.error]
     if failed:
         out.error(f"Failed to delete {len(failed)} table(s).")
         raise typer.Exit(1)
@@ -378,25 +405,35 @@ def schema_delete(
     force: bool = typer.Option(
         False, "--force", help="Force schema deletion even if not empty"
     ),
+    cascade: bool = typer.Option(
+        False,
+        "--cascade",
+        help="Drop the schema and all its tables in one request "
+        "(no per-table results; cannot be combined with --name)",
+    ),
+    parallel: int = TablesParallelOpt,
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would be deleted, but do nothing"
     ),
-    yes: bool = typer.Option(False, "--yes", help="Skip confirmation prompt"),
+    yes: bool = YesOpt,
 ):
     """Delete schema after taking ownership and deleting tables within it."""
+    from databricks.sdk.errors import NotFound, PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
     schema_full_name, _, _ = _parse_schema_or_exit(schema)
-    _compile_regex_or_exit(name, option_name="--name")
+    name_rx = _compile_regex_or_exit(name, option_name="--name")
 
     try:
         with out.status("Building deletion plan..."):
             plan = delete_schema_with_tables(
                 adapter,
                 schema_full_name=schema_full_name,
-                table_name_regex=name,
+                table_name_regex=name_rx,
                 force_schema_delete=force,
                 dry_run=True,
+                cascade=cascade,
             )
     except ValueError as exc:
         out.error(str(exc))
@@ -432,9 +469,12 @@ def schema_delete(
             result = delete_schema_with_tables(
                 adapter,
                 schema_full_name=schema_full_name,
-                table_name_regex=name,
+                table_name_regex=name_rx,
                 force_schema_delete=force,
                 dry_run=False,
+                pre_resolved_tables=plan["tables"],
+                max_parallel=parallel,
+                cascade=cascade,
             )
         except NotFound as exc:
             exit_from_exc(
@@ -451,9 +491,12 @@ def schema_delete(
             raise typer.Exit(2) from exc
 
     table_results = result.get("table_results", [])
-    out.uc_delete_results_table(table_results, title="Table deletion results")
+    if not cascade:
+        out.uc_delete_results_table(
+            table_results, title="Table deletion results", show_owner=False
+        )
 
-    failed = [r for r in table_results if getattr(r, "error", None)]
+    failed = [r for r in table_results if r.error]
     if failed:
         out.error(f"Failed to delete {len(failed)} table(s).")
         raise typer.Exit(1)
@@ -464,7 +507,7 @@ def schema_delete(
 @uc_app.command("schemas-drop-empty")
 def schemas_drop_empty(
     ctx: typer.Context,
-    catalog: str = typer.Option(..., "--catalog", help="Catalog name"),
+    catalog: str = CatalogOpt,
     name: str | None = typer.Option(
         None, "--name", help="Optional regex filter on schema full name"
     ),
@@ -472,19 +515,26 @@ def schemas_drop_empty(
         False, "--all", help="Drop all matched empty schemas without selection UI"
     ),
     force: bool = typer.Option(False, "--force", help="Force schema deletion"),
+    parallel: int = typer.Option(
+        8, "--parallel", "-n", min=1, help="Number of schemas to scan in parallel"
+    ),
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Show what would be deleted, but do nothing"
     ),
-    yes: bool = typer.Option(False, "--yes", help="Skip confirmation prompt"),
+    yes: bool = YesOpt,
 ):
     """Drop schemas that are currently empty (owner -> current user -> drop)."""
+    from databricks.sdk.errors import NotFound, PermissionDenied
+
     appctx: UCAppContext = ctx.obj
     adapter = appctx.adapter
-    _compile_regex_or_exit(name, option_name="--name")
+    name_rx = _compile_regex_or_exit(name, option_name="--name")
 
     try:
         with out.status("Scanning schemas for empties..."):
-            empty = find_empty_schemas(adapter, catalog=catalog, name_regex=name)
+            empty = find_empty_schemas(
+                adapter, catalog=catalog, name_regex=name_rx, max_parallel=parallel
+            )
     except NotFound as exc:
         exit_from_exc(exc, message=f"Catalog '{catalog}' does not exist.", code=1)
     except PermissionDenied as exc:
@@ -525,7 +575,7 @@ def schemas_drop_empty(
         results = drop_empty_schemas(adapter, selected, force=force, dry_run=False)
     out.uc_schema_drop_results_table(results, title="Schema drop results")
 
-    failed = [r for r in results if not getattr(r, "ok", False)]
+    failed = [r for r in results if not r.ok]
     if failed:
         out.error(f"Failed to drop {len(failed)} schema(s).")
         raise typer.Exit(1)
@@ -1,8 +1,7 @@
 """Banner utilities for the CLI."""
 
 import sys
-
-from rich import print as rprint
+from functools import lru_cache
 
 LOGO = r"""
 [bold red]
@@ -17,10 +16,17 @@ LOGO = r"""
 """
 
 
+@lru_cache(maxsize=1)
 def opt_print_banner() -> None:
     """
-    Print the BRICKOPS banner if help is requested.
+    Print the BRICKOPS banner if help is requested on a terminal.
     Example: `dbops --help` or `dbops jobs --help`, etc.
+
+    Printed at most once per process, and never when stdout is piped.
     """
+    if not sys.stdout.isatty():
+        return
     if any(arg in ("--help", "-h") for arg in sys.argv):
+        from rich import print as rprint
+
         rprint(LOGO)
@@ -1,31 +1,80 @@
 """Application context management for the CLI."""
 
-from dataclasses import dataclass
+from __future__ import annotations
 
-from databricks.sdk import WorkspaceClient
+from typing import TYPE_CHECKING
 
 from dbops.cli.common.exits import die
 from dbops.core.adapters.databricksjobs import DatabricksJobsAdapter
 from dbops.core.adapters.unitycatalog import UnityCatalogAdapter
 from dbops.core.auth import AuthError, get_client
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
+
+def _get_client_or_die(profile: str | None) -> WorkspaceClient:
+    """Create a workspace client, converting auth failures into a CLI exit."""
+    try:
+        return get_client(profile)
+    except AuthError as exc:
+        die(str(exc), code=1)
+
 
-@dataclass
 class JobsAppContext:
-    """Application context holding Databricks client and jobs adapter configuration."""
+    """Application context holding Databricks client and jobs adapter configuration.
+
+    The client and adapter are created on first access, so invocations that
+    never talk to the workspace (help, usage errors) skip authentication.
+    """
+
+    __slots__ = ("_adapter", "_client", "profile", "refresh_jobs")
+
+    def __init__(self, profile: str | None, *, refresh_jobs: bool = False) -> None:
+        self.profile = profile
+        self.refresh_jobs = refresh_jobs
+        self._client: WorkspaceClient | None = None
+        self._adapter: DatabricksJobsAdapter | None = None
+
+    @property
+    def client(self) -> WorkspaceClient:
+        if self._client is None:
+            self._client = _get_client_or_die(self.profile)
+        return self._client
 
-    profile: str | None
-    client: WorkspaceClient
-    adapter: DatabricksJobsAdapter
+    @property
+    def adapter(self) -> DatabricksJobsAdapter:
+        if self._adapter is None:
+            self._adapter = DatabricksJobsAdapter(
+                self.client, profile=self.profile, force_refresh=self.refresh_jobs
+            )
+        return self._adapter
 
 
-@dataclass
 class UCAppContext:
-    """Application context holding Databricks client and Unity Catalog adapter."""
+    """Application context holding Databricks client and Unity Catalog adapter.
+
+    The client and adapter are created on first access.
+    """
+
+    __slots__ = ("_adapter", "_client", "profile")
 
-    profile: str | None
-    client: WorkspaceClient
-    adapter: UnityCatalogAdapter
+    def __init__(self, profile: str | None) -> None:
+        self.profile = profile
+        self._client: WorkspaceClient | None = None
+        self._adapter: UnityCatalogAdapter | None = None
+
+    @property
+    def client(self) -> WorkspaceClient:
+        if self._client is None:
+            self._client = _get_client_or_die(self.profile)
+        return self._client
+
+    @property
+    def adapter(self) -> UnityCatalogAdapter:
+        if self._adapter is None:
+            self._adapter = UnityCatalogAdapter(self.client)
+        return self._adapter
 
 
 def build_jobs_context(
@@ -39,19 +88,16 @@ def build_jobs_context(
     Returns:
         JobsAppContext: Application context with configured client and adapter.
     """
-    try:
-        client = get_client(profile)
-    except AuthError as exc:
-        die(str(exc), code=1)
-    adapter = DatabricksJobsAdapter(client, profile=profile, force_refresh=refresh_jobs)
-    return JobsAppContext(profile=profile, client=client, adapter=adapter)
+    return JobsAppContext(profile, refresh_jobs=refresh_jobs)
 
 
 def build_uc_context(profile: str | None) -> UCAppContext:
-    """Build and return the application context for Unity Catalog commands."""
-    try:
-        client = get_client(profile)
-    except AuthError as exc:
-        die(str(exc), code=1)
-    adapter = UnityCatalogAdapter(client)
-    return UCAppContext(profile=profile, client=client, adapter=adapter)
+    """Build and return the application context for Unity Catalog commands.
+
+    Args:
+        profile: Optional Databricks profile name to use for authentication.
+
+    Returns:
+        UCAppContext: Application context with configured client and adapter.
+    """
+    return UCAppContext(profile)
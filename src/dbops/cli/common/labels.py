@@ -0,0 +1,27 @@
+"""Job label helpers shared by the selection prompt and run progress views."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+def truncate(text: str, max_len: int) -> str:
+    """Return text capped at max_len characters using an ASCII ellipsis."""
+    if len(text) <= max_len:
+        return text
+    if max_len <= 3:
+        return text[:max_len]
+    return f"{text[: max_len - 3]}..."
+
+
+def label_width(short_names: Iterable[str]) -> int:
+    """Return the name column width for a set of labels (0 if there are none).
+
+    Compute it once per list and pass it to every `format_job_label` call.
+    """
+    return max(map(len, short_names), default=0)
+
+
+def format_job_label(job_id: int, short_name: str, *, name_width: int) -> str:
+    """Format `<name>  (id: <job_id>)`, padding the name to align the id column."""
+    return f"{short_name.ljust(name_width)}  (id: {job_id})"
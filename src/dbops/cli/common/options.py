@@ -22,6 +22,16 @@ TagOpt = typer.Option(
     show_default=False,
 )
 
+LimitOpt = typer.Option(
+    None,
+    "--limit",
+    min=1,
+    help=(
+        "Maximum number of matched jobs to show. Listing stops early, "
+        "so the jobs cache is not refreshed"
+    ),
+)
+
 UseOrOpt = typer.Option(
     False,
     "--or",
@@ -33,7 +43,7 @@ ParallelOpt = typer.Option(
     "--parallel",
     "-n",
     min=1,
-    help="Number of jobs to start in parallel",
+    help="Number of jobs to start (and, with --watch, poll) in parallel",
 )
 
 ConfirmOpt = typer.Option(
@@ -60,3 +70,36 @@ RefreshOpt = typer.Option(
     "--refresh",
     help="Force refresh jobs cache (either part of another command or alone to just refresh cache)",
 )
+
+CatalogOpt = typer.Option(..., "--catalog", help="Catalog name")
+
+SchemaArg = typer.Argument(None, help="Schema in the form catalog.schema")
+
+SchemaOpt = typer.Option(
+    None,
+    "--schema",
+    help="Schema in the form catalog.schema",
+)
+
+TableNameOpt = typer.Option(
+    None,
+    "--name",
+    help="Regex filter for table full names",
+)
+
+TablesParallelOpt = typer.Option(
+    8,
+    "--parallel",
+    "-n",
+    min=1,
+    help="Number of tables to process in parallel",
+)
+
+PreviewOpt = typer.Option(
+    100,
+    "--preview",
+    min=0,
+    help="Maximum number of matched rows to show before selection",
+)
+
+YesOpt = typer.Option(False, "--yes", help="Skip confirmation prompt")
@@ -2,45 +2,129 @@
 
 from __future__ import annotations
 
+import inspect
+import os
+import sys
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping
+from functools import cache, lru_cache
+from itertools import starmap
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
-import questionary
-from rich.console import Console
-from rich.table import Table
-from rich.theme import Theme
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Mapping
 
-from dbops.cli.common.tui_style import (
-    QUESTIONARY_STYLE_CONFIRM,
-    QUESTIONARY_STYLE_SELECT,
-)
+    from rich.console import Console
+    from rich.table import Table
 
-_THEME = Theme(
-    {
-        "ok": "bold green",
-        "warn": "yellow",
-        "err": "bold red",
-        "title": "bold cyan",
-        "meta": "dim",
-    }
-)
+_TAG_FORMAT = "{}={}".format
+_OK_FORMAT = "[ok]{}[/ok]".format
+_ERR_FORMAT = "[err]{}[/err]".format
+_DELETE_RESULT_FIELDS = attrgetter("table", "owner_set", "deleted", "error")
+_OWNER_CHANGE_FIELDS = attrgetter("full_name", "new_owner", "ok", "error")
+_SCHEMA_DROP_FIELDS = attrgetter("schema_full_name", "ok", "error")
 
-console = Console(theme=_THEME)
+_THEME_STYLES = {
+    "ok": "bold green",
+    "warn": "yellow",
+    "err": "bold red",
+    "title": "bold cyan",
+    "meta": "dim",
+}
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Return the shared themed Rich console, creating it on first use.
+
+    Rich is imported lazily so commands that exit before printing (argument
+    errors, `--help`) do not pay for console setup.
+    """
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(theme=Theme(_THEME_STYLES))
+
+
+@lru_cache(maxsize=1)
+def get_stderr_console() -> Console:
+    """Return a themed Rich console that writes to stderr."""
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(theme=Theme(_THEME_STYLES), stderr=True)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module-level `console` lazily."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _format_tags(tags: Mapping[str, str] | None) -> str:
+    """Format job tags as `k=v, k2=v2` (empty string when there are none)."""
+    if not tags:
+        return ""
+    return ", ".join(starmap(_TAG_FORMAT, tags.items()))
+
+
+def _new_table(title: str) -> Table:
+    """Create an empty Rich table with the standard listing layout."""
+    from rich.table import Table
+
+    return Table(title=title, show_lines=False)
+
+
+_OUTPUT_ENV = "DBOPS_OUTPUT"
+_TSV_CELL_ESCAPES = str.maketrans("\t\n\r", "   ")
+
+
+def _plain_tables() -> bool:
+    """Return True if tables should be written as TSV instead of Rich tables.
+
+    `DBOPS_OUTPUT` may be `rich`, `tsv` or `auto` (default). In `auto` mode,
+    TSV is used when stdout is not a terminal (e.g. piped to grep/jq).
+    """
+    mode = os.getenv(_OUTPUT_ENV, "auto").strip().lower()
+    if mode == "tsv":
+        return True
+    if mode == "rich":
+        return False
+    return not sys.stdout.isatty()
+
+
+def _message_console() -> Console:
+    """Return the console for messages (headers, info, warnings, prompts).
+
+    When tables are written as TSV, messages go to stderr so that stdout
+    only carries the tab-separated rows.
+    """
+    return get_stderr_console() if _plain_tables() else get_console()
+
+
+# Styling kwargs that only some questionary versions/prompts accept. Unknown
+# kwargs are forwarded to prompt_toolkit and fail there, so filter them up front.
+_OPTIONAL_PROMPT_KWARGS = ("pointer", "checked_icon", "unchecked_icon", "auto_enter")
+
+
+@cache
+def _unsupported_prompt_kwargs(fn) -> frozenset[str]:
+    """Return the optional styling kwargs that a questionary prompt does not declare."""
+    params = inspect.signature(fn).parameters
+    return frozenset(k for k in _OPTIONAL_PROMPT_KWARGS if k not in params)
+
+
+@dataclass(frozen=True, slots=True)
 class Out:
     """Output formatter for CLI messages and tables."""
 
-    def _q_try(self, fn, *args, **kwargs):
-        """Call questionary prompts and drop unsupported kwargs on older versions."""
-        try:
-            return fn(*args, **kwargs)
-        except TypeError:
-            for k in ("pointer", "checked_icon", "unchecked_icon", "auto_enter"):
-                kwargs.pop(k, None)
-            return fn(*args, **kwargs)
+    def _q_call(self, fn, *args, **kwargs):
+        """Call a questionary prompt, dropping optional kwargs it does not declare."""
+        for k in _unsupported_prompt_kwargs(fn):
+            kwargs.pop(k, None)
+        return fn(*args, **kwargs)
 
     def _q(self, message: str) -> str:
         """Prefix Questionary prompts to be BRICK-OPS consistent."""
@@ -48,38 +132,40 @@ class Out:
 
     def info(self, msg: str) -> None:
         """Print an info message."""
-        console.print(f"[title]›[/] {msg}")
+        _message_console().print(f"[title]›[/] {msg}")
 
     @contextmanager
     def status(self, msg: str):
         """Show a transient status spinner while work is in progress."""
-        with console.status(msg, spinner="dots"):
+        with _message_console().status(msg, spinner="dots"):
             yield
 
     def success(self, msg: str) -> None:
         """Print a success message."""
-        console.print(f"[ok]✓[/] {msg}")
+        _message_console().print(f"[ok]✓[/] {msg}")
 
     def warn(self, msg: str) -> None:
         """Print a warning message."""
-        console.print(f"[warn]⚠[/] {msg}")
+        _message_console().print(f"[warn]⚠[/] {msg}")
 
     def error(self, msg: str) -> None:
         """Print an error message."""
-        console.print(f"[err]✗[/] {msg}")
+        _message_console().print(f"[err]✗[/] {msg}")
 
     def header(self, title: str) -> None:
         """Print a header message."""
-        console.print(f"[title]{title}[/]")
+        _message_console().print(f"[title]{title}[/]")
 
     def print(self, msg: str) -> None:
         """Print a raw Rich-formatted message to the console."""
-        console.print(msg)
+        _message_console().print(msg)
 
     def kv(self, items: Mapping[str, Any]) -> None:
         """Print key-value pairs."""
-        for k, v in items.items():
-            console.print(f"[meta]{k}[/]: {v}")
+        if items:
+            _message_console().print(
+                "\n".join(f"[meta]{k}[/]: {v}" for k, v in items.items())
+            )
 
     def select_many(self, message: str, choices: list[str]) -> list[str]:
         """
@@ -91,7 +177,12 @@ class Out:
         if not choices:
             return []
 
-        prompt = self._q_try(
+        # Imported lazily: questionary/prompt_toolkit are only needed for prompts.
+        import questionary
+
+        from dbops.cli.common.tui_style import QUESTIONARY_STYLE_SELECT
+
+        prompt = self._q_call(
             questionary.checkbox,
             self._q(message),
             choices=choices,
@@ -115,7 +206,11 @@ class Out:
         if not choices:
             return None
 
-        prompt = self._q_try(
+        import questionary
+
+        from dbops.cli.common.tui_style import QUESTIONARY_STYLE_SELECT
+
+        prompt = self._q_call(
             questionary.select,
             self._q(message),
             choices=choices,
@@ -142,9 +237,13 @@ class Out:
         """
         # Print instruction on its own line (Questionary renders `instruction=...` inline,
         # which looks odd next to the final echoed answer).
-        console.print("[meta]Use y/n then Enter[/]")
+        _message_console().print("[meta]Use y/n then Enter[/]")
 
-        prompt = self._q_try(
+        import questionary
+
+        from dbops.cli.common.tui_style import QUESTIONARY_STYLE_CONFIRM
+
+        prompt = self._q_call(
             questionary.confirm,
             self._q(message),
             default=default,
@@ -155,6 +254,19 @@ class Out:
         )
         return bool(prompt.ask())
 
+    def _write_tsv(self, rows: Iterable[tuple[str, ...]]) -> None:
+        """Write rows as tab-separated lines, bypassing Rich rendering.
+
+        Tabs and line breaks inside cells (for example multi-line SDK error
+        messages) are replaced with spaces so each row stays on one line.
+        """
+        sys.stdout.write(
+            "".join(
+                "\t".join(cell.translate(_TSV_CELL_ESCAPES) for cell in row) + "\n"
+                for row in rows
+            )
+        )
+
     def _job_label_from_id(
         self,
         job_id: Any,
@@ -171,7 +283,9 @@ class Out:
         job_name_by_id: Mapping[int, str] | None,
     ) -> tuple[str, str]:
         """Sort runs by visible job label, then by run id."""
-        job_label = self._job_label_from_id(getattr(run, "job_id", None), job_name_by_id)
+        job_label = self._job_label_from_id(
+            getattr(run, "job_id", None), job_name_by_id
+        )
         run_id = str(getattr(run, "run_id", ""))
         return (job_label.casefold(), run_id)
 
@@ -179,26 +293,30 @@ class Out:
         """
         Expects objects with .id .name .tags (like dbops.core.models.Job)
         """
-        t = Table(title=title, show_lines=False)
-        t.add_column("Job ID", style="ok", no_wrap=True)
-        t.add_column("Name")
-        t.add_column("Tags", style="meta")
-
-        jobs_list = sorted(
-            list(jobs),
-            key=lambda j: (
-                str(getattr(j, "name", "")).casefold(),
-                str(getattr(j, "id", "")),
+        rows = sorted(
+            (
+                (
+                    str(j.id),
+                    j.name,
+                    _format_tags(getattr(j, "tags", None)),
+                )
+                for j in jobs
             ),
+            key=lambda row: (str(row[1]).casefold(), row[0]),
         )
 
-        for j in jobs_list:
-            tags = ", ".join(
-                f"{k}={v}" for k, v in (getattr(j, "tags", None) or {}).items()
-            )
-            t.add_row(str(j.id), j.name, tags)
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
 
-        console.print(t)
+        t = _new_table(title)
+        t.add_column("Job ID", style="ok", no_wrap=True)
+        t.add_column("Name")
+        t.add_column("Tags", style="meta")
+        for row in rows:
+            t.add_row(*row)
+
+        get_console().print(t)
 
     def runs_table(
         self,
@@ -211,21 +329,27 @@ class Out:
         If `job_name_by_id` is provided, job names are rendered instead of IDs.
         (e.g. dbops.core.models.JobRun)
         """
-        t = Table(title=title, show_lines=False)
-        t.add_column("Job", style="ok", no_wrap=True)
-        t.add_column("Run ID", style="ok", no_wrap=True)
+        rows = [
+            (
+                self._job_label_from_id(getattr(r, "job_id", None), job_name_by_id),
+                str(r.run_id),
+            )
+            for r in sorted(
+                runs, key=lambda run: self._run_sort_key(run, job_name_by_id)
+            )
+        ]
 
-        runs_list = sorted(
-            list(runs),
-            key=lambda run: self._run_sort_key(run, job_name_by_id),
-        )
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
 
-        for r in runs_list:
-            job_id = getattr(r, "job_id", None)
-            job_label = self._job_label_from_id(job_id, job_name_by_id)
-            t.add_row(job_label, str(r.run_id))
+        t = _new_table(title)
+        t.add_column("Job", style="ok", no_wrap=True)
+        t.add_column("Run ID", style="ok", no_wrap=True)
+        for row in rows:
+            t.add_row(*row)
 
-        console.print(t)
+        get_console().print(t)
 
     def run_status_table(
         self,
@@ -237,30 +361,39 @@ class Out:
         Expects tuples of (JobRun, RunStatus).
         If `job_name_by_id` is provided, job names are rendered instead of IDs.
         """
-        t = Table(title=title, show_lines=False)
-        t.add_column("Job", style="ok", no_wrap=True)
-        t.add_column("Run ID", style="ok", no_wrap=True)
-        t.add_column("Status")
-
-        results_list = sorted(
-            list(results),
-            key=lambda item: self._run_sort_key(item[0], job_name_by_id),
+        results = list(results)
+        # All statuses share one type (normally RunStatus): pick the text
+        # conversion once instead of probing each row.
+        to_text = (
+            attrgetter("value") if results and hasattr(results[0][1], "value") else str
+        )
+        rows = sorted(
+            (
+                (
+                    self._job_label_from_id(
+                        getattr(run, "job_id", None), job_name_by_id
+                    ),
+                    str(run.run_id),
+                    to_text(status),
+                )
+                for run, status in results
+            ),
+            key=lambda row: (row[0].casefold(), row[1]),
         )
 
-        for run, status in results_list:
-            status_value = status.value if hasattr(status, "value") else str(status)
-            job_id = getattr(run, "job_id", None)
-            job_label = self._job_label_from_id(job_id, job_name_by_id)
-
-            style = "ok" if status_value == "SUCCESS" else "err"
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
 
-            t.add_row(
-                job_label,
-                str(run.run_id),
-                f"[{style}]{status_value}[/{style}]",
-            )
+        t = _new_table(title)
+        t.add_column("Job", style="ok", no_wrap=True)
+        t.add_column("Run ID", style="ok", no_wrap=True)
+        t.add_column("Status")
+        for job_label, run_id, status_value in rows:
+            fmt = _OK_FORMAT if status_value == "SUCCESS" else _ERR_FORMAT
+            t.add_row(job_label, run_id, fmt(status_value))
 
-        console.print(t)
+        get_console().print(t)
 
     def tables_table(self, tables: Iterable[Any], title: str = "Tables") -> None:
         """
@@ -270,120 +403,180 @@ class Out:
           - strings with fully qualified table names, or
           - objects with `.full_name`, optional `.owner`, optional `.table_type`.
         """
-        t = Table(title=title, show_lines=False)
-        t.add_column("Full name", style="ok")
-        t.add_column("Type", style="meta")
-        t.add_column("Owner", style="meta")
-
+        rows: list[tuple[str, str, str]] = []
         for item in tables:
             if isinstance(item, str):
-                full_name = item
-                table_type = ""
-                owner = ""
+                rows.append((item, "", ""))
             else:
-                full_name = getattr(item, "full_name", "") or ""
-                table_type = str(getattr(item, "table_type", "") or "")
-                owner = str(getattr(item, "owner", "") or "")
+                rows.append(
+                    (
+                        getattr(item, "full_name", "") or "",
+                        str(getattr(item, "table_type", "") or ""),
+                        str(getattr(item, "owner", "") or ""),
+                    )
+                )
 
-            t.add_row(full_name, table_type, owner)
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
 
-        console.print(t)
+        t = _new_table(title)
+        t.add_column("Full name", style="ok")
+        t.add_column("Type", style="meta")
+        t.add_column("Owner", style="meta")
+        for row in rows:
+            t.add_row(*row)
+
+        get_console().print(t)
 
     def uc_delete_results_table(
-        self, results: Iterable[Any], title: str = "Delete results"
+        self,
+        results: Iterable[Any],
+        title: str = "Delete results",
+        *,
+        show_owner: bool = True,
     ) -> None:
         """
         Render a results table for Unity Catalog table deletions.
 
-        Expects objects with:
+        Expects objects with (like dbops.core.catalog.UCTableDeleteResult):
           - `.table` (full name)
           - `.owner_set` (bool)
           - `.deleted` (bool)
-          - optional `.error` (str | None)
+          - `.error` (str | None)
+
+        Pass `show_owner=False` when table owners were not changed (for
+        example when the schema owner drops its tables), to leave out the
+        "Owner set" column.
         """
-        t = Table(title=title, show_lines=False)
+        rows = [
+            (
+                str(table),
+                *(("yes" if owner_set else "no",) if show_owner else ()),
+                "yes" if deleted else "no",
+                str(error or ""),
+            )
+            for table, owner_set, deleted, error in map(_DELETE_RESULT_FIELDS, results)
+        ]
+
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
+
+        t = _new_table(title)
         t.add_column("Table", style="ok")
-        t.add_column("Owner set")
+        if show_owner:
+            t.add_column("Owner set")
         t.add_column("Deleted")
         t.add_column("Error", style="err")
+        for row in rows:
+            t.add_row(*row)
 
-        for r in results:
-            owner_set = "yes" if getattr(r, "owner_set", False) else "no"
-            deleted = "yes" if getattr(r, "deleted", False) else "no"
-            err = str(getattr(r, "error", "") or "")
-            t.add_row(str(getattr(r, "table", "")), owner_set, deleted, err)
-
-        console.print(t)
+        get_console().print(t)
 
     def uc_owner_change_results_table(
         self, results, title: str = "Owner change results"
     ) -> None:
-        """Render results of UC ownership changes (success/fail per object)."""
-        t = Table(title=title, show_lines=False)
+        """Render results of UC ownership changes (success/fail per object).
+
+        Expects objects like dbops.core.catalog.UCOwnerChangeResult.
+        """
+        rows = [
+            (str(name), str(owner), ok, str(error or ""))
+            for name, owner, ok, error in map(_OWNER_CHANGE_FIELDS, results)
+        ]
+
+        if _plain_tables():
+            self._write_tsv(
+                (name, owner, "OK" if ok else "FAIL", err)
+                for name, owner, ok, err in rows
+            )
+            return
+
+        t = _new_table(title)
         t.add_column("Object", style="ok")
         t.add_column("New owner", style="meta")
         t.add_column("Result")
-
-        for r in results:
-            name = str(getattr(r, "full_name", "") or "")
-            owner = str(getattr(r, "new_owner", "") or "")
-            ok = bool(getattr(r, "ok", False))
-            err = getattr(r, "error", None)
+        for name, owner, ok, err in rows:
             t.add_row(name, owner, "[ok]OK[/]" if ok else f"[err]FAIL[/] {err}")
 
-        console.print(t)
+        get_console().print(t)
 
     def uc_schema_drop_results_table(
         self, results, title: str = "Schema drop results"
     ) -> None:
-        """Render results of dropping UC schemas (success/fail per schema)."""
-        t = Table(title=title, show_lines=False)
+        """Render results of dropping UC schemas (success/fail per schema).
+
+        Expects objects like dbops.core.catalog.UCSchemaDropResult.
+        """
+        rows = [
+            (str(name), ok, str(error or ""))
+            for name, ok, error in map(_SCHEMA_DROP_FIELDS, results)
+        ]
+
+        if _plain_tables():
+            self._write_tsv(
+                (name, "OK" if ok else "FAIL", err) for name, ok, err in rows
+            )
+            return
+
+        t = _new_table(title)
         t.add_column("Schema", style="ok")
         t.add_column("Result")
-
-        for r in results:
-            name = str(getattr(r, "schema_full_name", "") or "")
-            ok = bool(getattr(r, "ok", False))
-            err = getattr(r, "error", None)
+        for name, ok, err in rows:
             t.add_row(name, "[ok]OK[/]" if ok else f"[err]FAIL[/] {err}")
 
-        console.print(t)
+        get_console().print(t)
 
     def catalogs_table(self, catalogs: Iterable[Any], title: str = "Catalogs") -> None:
         """Render a table of Unity Catalog catalogs."""
-        t = Table(title=title, show_lines=False)
-        t.add_column("Catalog", style="ok")
-        t.add_column("Owner", style="meta")
-
+        rows: list[tuple[str, str]] = []
         for c in catalogs:
             if isinstance(c, str):
-                name = c
-                owner = ""
+                rows.append((c, ""))
             else:
-                name = str(getattr(c, "name", "") or "")
-                owner = str(getattr(c, "owner", "") or "")
-            t.add_row(name, owner)
+                rows.append(
+                    (
+                        str(getattr(c, "name", "") or ""),
+                        str(getattr(c, "owner", "") or ""),
+                    )
+                )
 
-        console.print(t)
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
 
-    def schemas_table(self, schemas: Iterable[Any], title: str = "Schemas") -> None:
-        """Render a table of Unity Catalog schemas."""
-        t = Table(title=title, show_lines=False)
-        t.add_column("Schema", style="ok")
+        t = _new_table(title)
+        t.add_column("Catalog", style="ok")
         t.add_column("Owner", style="meta")
+        for row in rows:
+            t.add_row(*row)
+
+        get_console().print(t)
 
+    def schemas_table(self, schemas: Iterable[Any], title: str = "Schemas") -> None:
+        """Render a table of Unity Catalog schemas."""
+        rows: list[tuple[str, str]] = []
         for s in schemas:
             if isinstance(s, str):
-                full_name = s
-                owner = ""
+                rows.append((s, ""))
             else:
                 full_name = str(getattr(s, "full_name", "") or "") or str(
                     getattr(s, "name", "") or ""
                 )
-                owner = str(getattr(s, "owner", "") or "")
-            t.add_row(full_name, owner)
+                rows.append((full_name, str(getattr(s, "owner", "") or "")))
+
+        if _plain_tables():
+            self._write_tsv(rows)
+            return
+
+        t = _new_table(title)
+        t.add_column("Schema", style="ok")
+        t.add_column("Owner", style="meta")
+        for row in rows:
+            t.add_row(*row)
 
-        console.print(t)
+        get_console().print(t)
 
 
 out = Out()
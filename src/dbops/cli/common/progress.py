@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Mapping
 
-from rich.console import Console, Group
+from rich.console import Group
 from rich.live import Live
 from rich.progress import (
     BarColumn,
@@ -16,45 +17,22 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from dbops.core.jobs import JobRun, RunStatus
+from dbops.cli.common.labels import format_job_label, label_width
+from dbops.cli.common.labels import truncate as _truncate
+from dbops.cli.common.output import get_console
+from dbops.core.jobs import TERMINAL_RUN_STATUSES, JobRun, RunStatus
 from dbops.core.runs import JobRunsAdapter
 
-console = Console()
 _MAX_JOB_NAME_WIDTH = 56
-
-
-def _truncate(text: str, max_len: int) -> str:
-    """Return text capped at max_len characters using an ASCII ellipsis."""
-    if max_len <= 3 or len(text) <= max_len:
-        return text[:max_len]
-    return f"{text[: max_len - 3]}..."
-
-
-def _display_job_label(
-    job_id: int,
-    job_name_by_id: Mapping[int, str] | None,
-    *,
-    name_width: int,
-) -> str:
-    """
-    Render a job label for the live progress list.
-
-    - With mapping: `<name>  (id: <id>)` with aligned id column.
-    - Without mapping (or if missing): fallback to just `<id>`.
-    """
-    if not job_name_by_id:
-        return str(job_id)
-
-    raw_name = job_name_by_id.get(job_id)
-    if raw_name is None:
-        return str(job_id)
-
-    name = str(raw_name)
-    if name == str(job_id):
-        return str(job_id)
-
-    short_name = _truncate(name, _MAX_JOB_NAME_WIDTH)
-    return f"{short_name.ljust(name_width)}  (id: {job_id})"
+_MAX_POLL_WORKERS = 32
+_FAILED: frozenset[RunStatus] = frozenset({RunStatus.FAILED, RunStatus.CANCELED})
+_STYLE_FOR: dict[RunStatus, str] = {
+    RunStatus.SUCCESS: "green",
+    RunStatus.FAILED: "red",
+    RunStatus.CANCELED: "red",
+    RunStatus.RUNNING: "yellow",
+    RunStatus.PENDING: "yellow",
+}
 
 
 def _run_display_sort_key(
@@ -62,7 +40,11 @@ def _run_display_sort_key(
     job_name_by_id: Mapping[int, str] | None,
 ) -> tuple[str, str]:
     """Sort runs by displayed job label, then by run id."""
-    job_label = str(job_name_by_id.get(run.job_id, run.job_id)) if job_name_by_id else str(run.job_id)
+    job_label = (
+        str(job_name_by_id.get(run.job_id, run.job_id))
+        if job_name_by_id
+        else str(run.job_id)
+    )
     return (job_label.casefold(), str(run.run_id))
 
 
@@ -71,33 +53,35 @@ def wait_for_runs_with_progress(
     runs: list[JobRun],
     poll_interval: int = 5,
     job_name_by_id: Mapping[int, str] | None = None,
+    max_poll_interval: float = 60,
+    max_parallel: int = _MAX_POLL_WORKERS,
 ) -> list[tuple[JobRun, RunStatus]]:
     """
     Poll all runs until they reach a terminal state. Shows:
       - an overall progress bar (x/y completed + failures)
       - per-run spinner rows with elapsed timers (stops per run when finished)
 
+    Each run is polled on its own schedule: the delay starts at
+    `poll_interval`, doubles while the run's status is unchanged (capped at
+    `max_poll_interval`), and resets when the status changes. Due runs are
+    polled concurrently, at most `max_parallel` at a time.
+
     Returns list of (JobRun, RunStatus).
     """
-    statuses: dict[int, RunStatus] = {r.run_id: RunStatus.PENDING for r in runs}
+    run_ids = [r.run_id for r in runs]
+    statuses: dict[int, RunStatus] = dict.fromkeys(run_ids, RunStatus.PENDING)
+    attempts: dict[int, int] = dict.fromkeys(run_ids, 0)
+    next_poll_at: dict[int, float] = dict.fromkeys(run_ids, time.monotonic())
     finished: set[int] = set()
     failures = 0
-    shown_job_names = [
-        _truncate(str(name), _MAX_JOB_NAME_WIDTH)
-        for r in runs
-        for name in [job_name_by_id.get(r.job_id) if job_name_by_id else None]
-        if name is not None and str(name) != str(r.job_id)
-    ]
-    name_width = max((len(name) for name in shown_job_names), default=0)
-
-    def _style_for(status: RunStatus) -> str:
-        if status == RunStatus.SUCCESS:
-            return "green"
-        if status in (RunStatus.FAILED, RunStatus.CANCELED):
-            return "red"
-        if status in (RunStatus.RUNNING, RunStatus.PENDING):
-            return "yellow"
-        return "dim"
+    # Truncated display names per job, computed once for width and labels.
+    short_names: dict[int, str] = {}
+    if job_name_by_id:
+        for r in runs:
+            name = job_name_by_id.get(r.job_id)
+            if name is not None and str(name) != str(r.job_id):
+                short_names[r.job_id] = _truncate(str(name), _MAX_JOB_NAME_WIDTH)
+    name_width = label_width(short_names.values())
 
     # Overall bar (no per-run fields here)
     overall = Progress(
@@ -106,7 +90,7 @@ def wait_for_runs_with_progress(
         TaskProgressColumn(),  # e.g. 2/5
         TextColumn("failures=[bold red]{task.fields[failures]}[/]"),
         TimeElapsedColumn(),
-        console=console,
+        console=get_console(),
     )
 
     # Per-run rows (expects job/run_id/status fields)
@@ -118,7 +102,7 @@ def wait_for_runs_with_progress(
             "status=[{task.fields[style]}]{task.fields[status]}[/{task.fields[style]}]"
         ),
         TimeElapsedColumn(),
-        console=console,
+        console=get_console(),
     )
 
     overall_task_id = overall.add_task(
@@ -133,10 +117,11 @@ def wait_for_runs_with_progress(
         key=lambda run: _run_display_sort_key(run, job_name_by_id),
     )
     for r in display_runs:
-        job_label = _display_job_label(
-            r.job_id,
-            job_name_by_id,
-            name_width=name_width,
+        short_name = short_names.get(r.job_id)
+        job_label = (
+            format_job_label(r.job_id, short_name, name_width=name_width)
+            if short_name is not None
+            else str(r.job_id)
         )
         task_ids[r.run_id] = per_run.add_task(
             "",
@@ -144,31 +129,51 @@ def wait_for_runs_with_progress(
             job=job_label,
             run_id=str(r.run_id),
             status="PENDING",
-            style=_style_for(RunStatus.PENDING),
+            style=_STYLE_FOR[RunStatus.PENDING],
         )
 
     group = Group(overall, per_run)
 
-    with Live(group, console=console, refresh_per_second=10, transient=True):
+    # Progress.update() only records state; the Live owner renders it. Keep the
+    # background refresh slow (spinners/timers) and redraw once per poll cycle.
+    # Status calls are independent REST round-trips, so they run concurrently;
+    # Rich updates stay on this thread.
+    workers = max(1, min(max_parallel, len(runs)))
+    with (
+        ThreadPoolExecutor(max_workers=workers) as pool,
+        Live(
+            group, console=get_console(), refresh_per_second=4, transient=True
+        ) as live,
+    ):
         while len(finished) < len(runs):
-            for r in runs:
-                if r.run_id in finished:
-                    continue
-
-                st = adapter.get_run_status(r.run_id)
+            now = time.monotonic()
+            futures = {
+                pool.submit(adapter.get_run_status, r.run_id): r
+                for r in runs
+                if r.run_id not in finished and next_poll_at[r.run_id] <= now
+            }
+            for fut in as_completed(futures):
+                r = futures[fut]
+                st = fut.result()
+                if st == statuses[r.run_id]:
+                    attempts[r.run_id] += 1
+                else:
+                    attempts[r.run_id] = 0
                 statuses[r.run_id] = st
+                delay = min(poll_interval * 2 ** attempts[r.run_id], max_poll_interval)
+                next_poll_at[r.run_id] = time.monotonic() + delay
 
                 per_run.update(
                     task_ids[r.run_id],
                     status=st.value,
-                    style=_style_for(st),
+                    style=_STYLE_FOR.get(st, "dim"),
                 )
 
-                if st in (RunStatus.SUCCESS, RunStatus.FAILED, RunStatus.CANCELED):
+                if st in TERMINAL_RUN_STATUSES:
                     finished.add(r.run_id)
 
                     # Count failures (FAILED or CANCELED)
-                    if st in (RunStatus.FAILED, RunStatus.CANCELED):
+                    if st in _FAILED:
                         failures += 1
                         overall.update(overall_task_id, failures=failures)
 
@@ -177,14 +182,17 @@ def wait_for_runs_with_progress(
                     per_run.update(
                         task_ids[r.run_id],
                         status=done_label,
-                        style=_style_for(st),
+                        style=_STYLE_FOR.get(st, "dim"),
                         completed=1,  # stops spinner + freezes elapsed
                     )
 
                     overall.advance(overall_task_id, 1)
 
-            time.sleep(poll_interval)
+            live.refresh()
+            pending = [t for rid, t in next_poll_at.items() if rid not in finished]
+            if pending:
+                time.sleep(max(0.0, min(pending) - time.monotonic()))
 
         overall.update(overall_task_id, completed=len(runs))
 
-    return [(r, statuses[r.run_id]) for r in runs]
+    return [(r, statuses[rid]) for r, rid in zip(runs, run_ids)]
@@ -54,10 +54,10 @@ def build_selector(
         selectors.append(NameRegexSelector(name))
 
     for tag in tags:
-        if "=" not in tag:
+        key, sep, value = tag.partition("=")
+        if not sep:
             raise ValueError(f"Invalid tag selector: '{tag}' (expecting key=value)")
 
-        key, value = tag.split("=", 1)
         selectors.append(TagSelector(key, value))
 
     if not selectors:
@@ -2,25 +2,23 @@
 
 from __future__ import annotations
 
-import questionary
-
-from dbops.cli.common.tui_style import QUESTIONARY_STYLE_SELECT
+from dbops.cli.common.labels import format_job_label, label_width
+from dbops.cli.common.labels import truncate as _truncate
 from dbops.core.jobs import Job
 
 _MAX_JOB_NAME_WIDTH = 96
 
 
-def _truncate(text: str, max_len: int) -> str:
-    """Return text capped at max_len characters using an ASCII ellipsis."""
-    if max_len <= 3 or len(text) <= max_len:
-        return text[:max_len]
-    return f"{text[: max_len - 3]}..."
-
+def _job_choice_title(
+    job: Job, *, name_width: int, short_name: str | None = None
+) -> str:
+    """Format one job choice as `<name>  (id: <job_id>)` with aligned id column.
 
-def _job_choice_title(job: Job, *, name_width: int) -> str:
-    """Format one job choice as `<name>  (id: <job_id>)` with aligned id column."""
-    short_name = _truncate(job.name, _MAX_JOB_NAME_WIDTH)
-    return f"{short_name.ljust(name_width)}  (id: {job.id})"
+    Pass `short_name` when the truncated name has already been computed.
+    """
+    if short_name is None:
+        short_name = _truncate(job.name, _MAX_JOB_NAME_WIDTH)
+    return format_job_label(job.id, short_name, name_width=name_width)
 
 
 def _sort_jobs_for_display(jobs: list[Job]) -> list[Job]:
@@ -37,16 +35,21 @@ def select_jobs(jobs: list[Job]) -> list[Job]:
     Returns:
         A list of selected Job objects, or an empty list if none selected.
     """
+    # Imported lazily: questionary/prompt_toolkit are only needed for prompts.
+    import questionary
+
+    from dbops.cli.common.tui_style import QUESTIONARY_STYLE_SELECT
+
     jobs = _sort_jobs_for_display(jobs)
     shown_names = [_truncate(job.name, _MAX_JOB_NAME_WIDTH) for job in jobs]
-    name_width = max((len(name) for name in shown_names), default=0)
+    name_width = label_width(shown_names)
 
     choices = [
         questionary.Choice(
-            title=_job_choice_title(job, name_width=name_width),
+            title=_job_choice_title(job, name_width=name_width, short_name=name),
             value=job,
         )
-        for job in jobs
+        for job, name in zip(jobs, shown_names)
     ]
 
     return (
@@ -3,14 +3,45 @@ from __future__ import annotations
 import json
 import os
 import re
+import tempfile
 import time
 from pathlib import Path
-
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.jobs import RunResultState
+from typing import TYPE_CHECKING, Iterator
 
 from dbops.core.jobs import Job, JobRun, RunStatus
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+_SAFE_KEY_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+# SDK RunResultState values (keyed by enum value, so the SDK service module
+# does not need importing) that map to a terminal RunStatus.
+_RESULT_STATUS = {
+    "SUCCESS": RunStatus.SUCCESS,
+    "FAILED": RunStatus.FAILED,
+    "CANCELED": RunStatus.CANCELED,
+    "TIMEDOUT": RunStatus.FAILED,
+}
+
+
+def _dumps(payload: object) -> bytes:
+    """Serialize the cache payload, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _loads(data: bytes) -> object:
+    """Parse the cache payload, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class DatabricksJobsAdapter:
     """Adapter around Databricks SDK Jobs APIs."""
@@ -19,6 +50,8 @@ class DatabricksJobsAdapter:
     _CACHE_DISABLE_ENV = "DBOPS_JOBS_CACHE_DISABLE"
     _CACHE_DIR_ENV = "DBOPS_CACHE_DIR"
     _DEFAULT_CACHE_TTL_SECONDS = 300
+    # Largest page size jobs/list accepts (the API default is 20).
+    _JOBS_PAGE_SIZE = 100
 
     def __init__(
         self,
@@ -32,6 +65,10 @@ class DatabricksJobsAdapter:
         self.profile = profile or "default"
         self._cache_path = self._build_cache_path()
         self._force_refresh = force_refresh
+        self._terminal_status: dict[int, RunStatus] = {}
+        # Cache settings come from the environment; resolve them once.
+        self._cache_ttl = self._cache_ttl_seconds()
+        self._use_cache = self._cache_enabled()
 
     def _build_cache_path(self) -> Path:
         """Return the cache file path for this workspace/profile."""
@@ -44,7 +81,7 @@ class DatabricksJobsAdapter:
         cache_dir = base / "dbops"
         host = getattr(getattr(self.client, "config", None), "host", None) or "unknown"
         key = f"{self.profile}@{host}"
-        safe_key = re.sub(r"[^A-Za-z0-9_.-]+", "_", key)
+        safe_key = _SAFE_KEY_RE.sub("_", key)
         return cache_dir / f"jobs_{safe_key}.json"
 
     def _cache_ttl_seconds(self) -> int:
@@ -62,25 +99,25 @@ class DatabricksJobsAdapter:
         disabled = os.getenv(self._CACHE_DISABLE_ENV, "").strip().lower()
         if disabled in {"1", "true", "yes"}:
             return False
-        return self._cache_ttl_seconds() > 0
+        return self._cache_ttl > 0
 
     def _load_cached_jobs(self) -> list[Job] | None:
         """Load cached jobs if the cache is fresh."""
         if self._force_refresh:
             return None
-        if not self._cache_enabled():
+        if not self._use_cache:
             return None
         path = self._cache_path
         if not path.exists():
             return None
         try:
-            payload = json.loads(path.read_text())
+            payload = _loads(path.read_bytes())
         except (OSError, json.JSONDecodeError):
             return None
         timestamp = payload.get("timestamp")
         if not isinstance(timestamp, (int, float)):
             return None
-        if time.time() - float(timestamp) > self._cache_ttl_seconds():
+        if time.time() - float(timestamp) > self._cache_ttl:
             return None
         jobs = []
         for item in payload.get("jobs", []):
@@ -98,7 +135,7 @@ class DatabricksJobsAdapter:
 
     def _store_cached_jobs(self, jobs: list[Job]) -> None:
         """Persist jobs to the cache on disk."""
-        if not self._cache_enabled():
+        if not self._use_cache:
             return
         path = self._cache_path
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -109,31 +146,50 @@ class DatabricksJobsAdapter:
                 for job in jobs
             ],
         }
-        path.write_text(json.dumps(payload))
-
-    def find_all_jobs(self) -> list[Job]:
-        """Return all jobs in the workspace (cached when enabled)."""
+        # Write to a temp file and rename so an interrupted write never leaves
+        # a truncated cache behind.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(payload))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def iter_all_jobs(self) -> Iterator[Job]:
+        """
+        Yield all jobs in the workspace (cached when enabled).
+
+        Jobs are yielded as the SDK pages through the listing, so callers can
+        filter while later pages are still being fetched. The cache is only
+        rewritten once the listing has been consumed completely.
+        """
         cached = self._load_cached_jobs()
         if cached is not None:
-            return cached
+            yield from cached
+            return
 
         jobs: list[Job] = []
 
-        for j in self.client.jobs.list():
+        for j in self.client.jobs.list(limit=self._JOBS_PAGE_SIZE):
             if not j.settings or not j.settings.name:
                 continue
 
-            jobs.append(
-                Job(
-                    id=j.job_id,
-                    name=j.settings.name,
-                    tags=j.settings.tags or {},
-                )
+            job = Job(
+                id=j.job_id,
+                name=j.settings.name,
+                tags=j.settings.tags or {},
             )
+            jobs.append(job)
+            yield job
 
         self._store_cached_jobs(jobs)
         self._force_refresh = False
-        return jobs
+
+    def find_all_jobs(self) -> list[Job]:
+        """Return all jobs in the workspace (cached when enabled)."""
+        return list(self.iter_all_jobs())
 
     def start_job(self, job_id: int) -> JobRun:
         """Start a Databricks job and return its run handle."""
@@ -141,19 +197,29 @@ class DatabricksJobsAdapter:
         return JobRun(run_id=run.run_id, job_id=job_id)
 
     def get_run_status(self, run_id: int) -> RunStatus:
-        """Return the current status for a Databricks job run."""
+        """
+        Return the current status for a Databricks job run.
+
+        Terminal statuses (SUCCESS/FAILED/CANCELED) cannot change, so they are
+        remembered and returned without another API call.
+        """
+        cached = self._terminal_status.get(run_id)
+        if cached is not None:
+            return cached
+
         run = self.client.jobs.get_run(run_id)
-        state = run.state
+        return self._record_status(run_id, run.state)
 
+    def _record_status(self, run_id: int, state) -> RunStatus:
+        """Map an SDK run state to a RunStatus, remembering terminal ones."""
         if not state:
             return RunStatus.UNKNOWN
 
-        if state.result_state == RunResultState.SUCCESS:
-            return RunStatus.SUCCESS
-        if state.result_state == RunResultState.FAILED:
-            return RunStatus.FAILED
-        if state.result_state == RunResultState.CANCELED:
-            return RunStatus.CANCELED
+        result_state = state.result_state
+        status = _RESULT_STATUS.get(getattr(result_state, "value", result_state))
+        if status is not None:
+            self._terminal_status[run_id] = status
+            return status
 
         if state.life_cycle_state:
             return RunStatus.RUNNING
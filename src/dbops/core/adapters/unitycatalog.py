@@ -1,37 +1,49 @@
 from __future__ import annotations
 
-from databricks.sdk import WorkspaceClient
+from typing import TYPE_CHECKING, Iterator
 
 from dbops.core.uc import UCCatalog, UCSchema, UCTable
 
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
+
 
 class UnityCatalogAdapter:
     """Adapter around Databricks SDK Unity Catalog APIs (tables/schemas/current user)."""
 
     def __init__(self, client: WorkspaceClient) -> None:
         self.client = client
+        self._current_username: str | None = None
 
     def current_username(self) -> str:
-        """Return the current principal username/email for ownership operations."""
-        me = self.client.current_user.me()
-        # SDK uses user_name for SCIM-style usernames (often email)
-        if not getattr(me, "user_name", None):
-            raise ValueError("Could not determine current user (user_name is empty).")
-        return me.user_name
+        """Return the current principal username/email for ownership operations.
+
+        The value is fetched once per adapter and reused afterwards.
+        """
+        if self._current_username is None:
+            me = self.client.current_user.me()
+            # SDK uses user_name for SCIM-style usernames (often email)
+            if not getattr(me, "user_name", None):
+                raise ValueError(
+                    "Could not determine current user (user_name is empty)."
+                )
+            self._current_username = me.user_name
+        return self._current_username
 
-    def list_catalogs(self) -> list[UCCatalog]:
-        """List all Unity Catalog catalogs visible to the current principal."""
-        out: list[UCCatalog] = []
+    def iter_catalogs(self) -> Iterator[UCCatalog]:
+        """Yield Unity Catalog catalogs as the SDK pages through them."""
         for c in self.client.catalogs.list():
             name = getattr(c, "name", None)
             if not name:
                 continue
-            out.append(UCCatalog(name=name, owner=getattr(c, "owner", None)))
-        return out
+            yield UCCatalog(name=name, owner=getattr(c, "owner", None))
 
-    def list_schemas(self, catalog: str) -> list[UCSchema]:
-        """List schemas in a given catalog."""
-        out: list[UCSchema] = []
+    def list_catalogs(self) -> list[UCCatalog]:
+        """List all Unity Catalog catalogs visible to the current principal."""
+        return list(self.iter_catalogs())
+
+    def iter_schemas(self, catalog: str) -> Iterator[UCSchema]:
+        """Yield schemas in a given catalog as the SDK pages through them."""
         for s in self.client.schemas.list(catalog_name=catalog):
             name = getattr(s, "name", None)
             full_name = getattr(s, "full_name", None)
@@ -46,34 +58,57 @@ class UnityCatalogAdapter:
             if not name or not full_name:
                 continue
 
-            out.append(
-                UCSchema(
-                    full_name=full_name,
-                    name=name,
-                    catalog_name=catalog_name,
-                    owner=getattr(s, "owner", None),
-                )
+            yield UCSchema(
+                full_name=full_name,
+                name=name,
+                catalog_name=catalog_name,
+                owner=getattr(s, "owner", None),
             )
-        return out
 
-    def list_tables(self, catalog: str, schema: str) -> list[UCTable]:
-        """List tables in a given catalog.schema."""
-        out: list[UCTable] = []
-        for t in self.client.tables.list(catalog_name=catalog, schema_name=schema):
+    def list_schemas(self, catalog: str) -> list[UCSchema]:
+        """List schemas in a given catalog."""
+        return list(self.iter_schemas(catalog=catalog))
+
+    def iter_tables(self, catalog: str, schema: str) -> Iterator[UCTable]:
+        """Yield tables in a given catalog.schema as the SDK pages through them."""
+        # Only name/owner/type are read: skip column and property payloads.
+        tables = self.client.tables.list(
+            catalog_name=catalog,
+            schema_name=schema,
+            omit_columns=True,
+            omit_properties=True,
+        )
+        for t in tables:
             # TableInfo has .full_name, .owner, .table_type (string/enum depending on SDK)
             full_name = getattr(t, "full_name", None)
             if not full_name:
                 continue
-            out.append(
-                UCTable(
-                    full_name=full_name,
-                    owner=getattr(t, "owner", None),
-                    table_type=str(getattr(t, "table_type", None))
-                    if getattr(t, "table_type", None)
-                    else None,
-                )
+            yield UCTable(
+                full_name=full_name,
+                owner=getattr(t, "owner", None),
+                table_type=str(getattr(t, "table_type", None))
+                if getattr(t, "table_type", None)
+                else None,
             )
-        return out
+
+    def schema_has_tables(self, catalog: str, schema: str) -> bool:
+        """Return True if catalog.schema contains at least one table.
+
+        Requests a single-row page (without column or property payloads) and
+        stops after the first table, instead of listing the whole schema.
+        """
+        tables = self.client.tables.list(
+            catalog_name=catalog,
+            schema_name=schema,
+            max_results=1,
+            omit_columns=True,
+            omit_properties=True,
+        )
+        return next(iter(tables), None) is not None
+
+    def list_tables(self, catalog: str, schema: str) -> list[UCTable]:
+        """List tables in a given catalog.schema."""
+        return list(self.iter_tables(catalog=catalog, schema=schema))
 
     def set_table_owner(self, full_name: str, owner: str) -> None:
         """Set table owner."""
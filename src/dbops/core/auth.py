@@ -5,10 +5,15 @@ small but important normalization rules (such as sanitizing the host URL)
 to avoid subtle SDK and API issues.
 """
 
+from __future__ import annotations
+
 import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
 
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.core import Config
+_LOGIN_RE = re.compile(r"databricks auth login (\S+)")
 
 
 class AuthError(RuntimeError):
@@ -17,7 +22,7 @@ class AuthError(RuntimeError):
 
 def _format_auth_error(message: str, profile: str | None) -> str:
     """Return a user-friendly auth error message."""
-    login_match = re.search(r"databricks auth login ([^\\s]+)", message)
+    login_match = _LOGIN_RE.search(message)
     host = login_match.group(1) if login_match else None
     if host:
         cmd = "databricks auth login"
@@ -43,7 +48,7 @@ def _sanitize_host(host: str | None) -> str | None:
     if not host:
         return host
     # strip querystring zoals ?o=....
-    host = host.split("?", 1)[0]
+    host = host.partition("?")[0]
     # strip trailing slash
     return host.rstrip("/")
 
@@ -57,7 +62,14 @@ def get_client(profile: str | None = None) -> WorkspaceClient:
 
     The host URL is sanitized to remove query strings and trailing slashes
     before constructing the client.
+
+    Raises:
+        AuthError: If the profile cannot be resolved.
     """
+    # Imported here: loading databricks.sdk takes most of the CLI start-up time.
+    from databricks.sdk import WorkspaceClient
+    from databricks.sdk.core import Config
+
     try:
         cfg = Config(profile=profile) if profile else Config()
     except ValueError as exc:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator, NamedTuple
 
 from dbops.core.adapters.unitycatalog import UnityCatalogAdapter
+from dbops.core.patterns import compile_pattern, is_literal_pattern, matcher
 from dbops.core.uc import UCTable
 
 
-@dataclass(frozen=True)
-class UCTableDeleteResult:
+class UCTableDeleteResult(NamedTuple):
     """Result for a single UC table delete operation."""
 
     table: str
@@ -18,23 +19,66 @@ class UCTableDeleteResult:
     error: str | None = None
 
 
+_SCHEMA_FULL_NAME_RE = re.compile(r"([^.]+)\.([^.]+)")
+
+
 def parse_schema_full_name(schema_full_name: str) -> tuple[str, str]:
     """Split `catalog.schema` into (catalog, schema)."""
-    parts = schema_full_name.strip().split(".")
-    if len(parts) != 2:
-        raise ValueError("Schema must be in the form `catalog.schema`.")
-    catalog, schema = parts
-    if not catalog or not schema:
+    m = _SCHEMA_FULL_NAME_RE.fullmatch(schema_full_name.strip())
+    if m is None:
         raise ValueError("Schema must be in the form `catalog.schema`.")
-    return catalog, schema
+    return m[1], m[2]
 
 
-def filter_tables(tables: list[UCTable], name_regex: str | None) -> list[UCTable]:
-    """Filter tables by regex on full_name (or keep all if regex is None)."""
+def filter_tables_iter(
+    tables: Iterable[UCTable], name_regex: str | re.Pattern | None
+) -> Iterator[UCTable]:
+    """Lazily filter tables by regex on full_name (or keep all if regex is None).
+
+    Tables are yielded as they are consumed, so a streamed listing (e.g.
+    `adapter.iter_tables(...)`) is filtered in a single pass. `name_regex`
+    may be a pattern string or an already compiled pattern.
+    """
     if not name_regex:
-        return tables
-    rx = re.compile(name_regex)
-    return [t for t in tables if rx.search(t.full_name)]
+        return iter(tables)
+    if not isinstance(name_regex, str):
+        search = matcher(name_regex)
+        return (t for t in tables if search(t.full_name))
+    if is_literal_pattern(name_regex):
+        return (t for t in tables if name_regex in t.full_name)
+    search = matcher(compile_pattern(name_regex))
+    return (t for t in tables if search(t.full_name))
+
+
+def filter_tables(
+    tables: Iterable[UCTable], name_regex: str | re.Pattern | None
+) -> list[UCTable]:
+    """Filter tables by regex on full_name (or keep all if regex is None).
+
+    Materialized form of `filter_tables_iter`.
+    """
+    return list(filter_tables_iter(tables, name_regex))
+
+
+def _delete_table(
+    adapter: UnityCatalogAdapter,
+    full_name: str,
+    owner: str | None,
+    *,
+    set_owner: bool = True,
+) -> UCTableDeleteResult:
+    """Set the owner of a single table, then delete it, capturing any error."""
+    try:
+        if set_owner:
+            if owner is None:
+                raise RuntimeError("Owner resolution failed for table delete.")
+            adapter.set_table_owner(full_name, owner=owner)
+        adapter.delete_table(full_name)
+        return UCTableDeleteResult(table=full_name, owner_set=set_owner, deleted=True)
+    except Exception as e:  # keep CLI resilient; surface per-table errors
+        return UCTableDeleteResult(
+            table=full_name, owner_set=False, deleted=False, error=str(e)
+        )
 
 
 def delete_tables(
@@ -42,61 +86,95 @@ def delete_tables(
     table_full_names: list[str],
     *,
     dry_run: bool = False,
+    max_parallel: int = 8,
+    owner: str | None = None,
+    skip_table_owner: bool = False,
 ) -> list[UCTableDeleteResult]:
     """
     For each table:
-      1) set owner to current user
+      1) set owner to current user (unless `skip_table_owner`)
       2) delete table
-    """
-    results: list[UCTableDeleteResult] = []
-    owner = adapter.current_username() if not dry_run else None
 
-    for full_name in table_full_names:
-        if dry_run:
-            results.append(
-                UCTableDeleteResult(table=full_name, owner_set=False, deleted=False)
-            )
-            continue
+    Tables are processed concurrently (up to `max_parallel` at a time) since
+    each delete is an independent API round-trip. Results are returned in
+    the same order as `table_full_names`.
 
-        try:
-            if owner is None:
-                raise RuntimeError("Owner resolution failed for table delete.")
-            adapter.set_table_owner(full_name, owner=owner)
-            adapter.delete_table(full_name)
-            results.append(
-                UCTableDeleteResult(table=full_name, owner_set=True, deleted=True)
-            )
-        except Exception as e:  # keep CLI resilient; surface per-table errors
-            results.append(
-                UCTableDeleteResult(
-                    table=full_name, owner_set=False, deleted=False, error=str(e)
-                )
-            )
+    If `owner` is given it is used instead of looking up the current user.
+    `skip_table_owner` is for callers that already own the parent schema,
+    which is enough to drop its tables; results then report `owner_set=False`.
+    """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
 
-    return results
+    if dry_run:
+        return [
+            UCTableDeleteResult(table=full_name, owner_set=False, deleted=False)
+            for full_name in table_full_names
+        ]
+    if not table_full_names:
+        return []
+
+    set_owner = not skip_table_owner
+    if set_owner and owner is None:
+        owner = adapter.current_username()
+    workers = min(max_parallel, len(table_full_names))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda full_name: _delete_table(
+                    adapter, full_name, owner, set_owner=set_owner
+                ),
+                table_full_names,
+            )
+        )
 
 
 def delete_schema_with_tables(
     adapter: UnityCatalogAdapter,
     schema_full_name: str,
     *,
-    table_name_regex: str | None = None,
+    table_name_regex: str | re.Pattern | None = None,
     force_schema_delete: bool = False,
     dry_run: bool = False,
+    pre_resolved_tables: list[str] | None = None,
+    max_parallel: int = 8,
+    cascade: bool = False,
 ) -> dict[str, object]:
     """
     Delete schema by:
       1) set schema owner to current user
       2) list tables in schema (optionally regex-filtered)
-      3) set table owner -> delete each table
+      3) delete each table (schema ownership covers dropping its tables)
       4) delete schema
+
+    If `pre_resolved_tables` is given (e.g. `plan["tables"]` from a previous
+    dry-run), those tables are used as-is and the listing step is skipped.
+    Tables are deleted with up to `max_parallel` concurrent requests.
+
+    With `cascade=True`, steps 2-3 are replaced by a single forced schema
+    delete that drops every table server-side; no per-table results are
+    returned, and the listing is only done for dry-run plans.
     """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
+    if cascade and table_name_regex:
+        raise ValueError(
+            "cascade drops every table in the schema; "
+            "it cannot be combined with a table filter."
+        )
+
     owner = adapter.current_username()
     catalog, schema = parse_schema_full_name(schema_full_name)
 
-    tables = adapter.list_tables(catalog=catalog, schema=schema)
-    tables = filter_tables(tables, table_name_regex)
-    table_names = [t.full_name for t in tables]
+    if pre_resolved_tables is not None:
+        table_names = list(pre_resolved_tables)
+    elif cascade and not dry_run:
+        table_names = []
+    else:
+        tables = filter_tables_iter(
+            adapter.iter_tables(catalog=catalog, schema=schema), table_name_regex
+        )
+        table_names = [t.full_name for t in tables]
 
     if dry_run:
         return {
@@ -107,7 +185,23 @@ def delete_schema_with_tables(
         }
 
     adapter.set_schema_owner(schema_full_name, owner=owner)
-    table_results = delete_tables(adapter, table_names, dry_run=False)
+    if cascade:
+        adapter.delete_schema(schema_full_name, force=True)
+        return {
+            "schema": schema_full_name,
+            "owner": owner,
+            "tables": table_names,
+            "table_results": [],
+            "schema_deleted": True,
+        }
+
+    table_results = delete_tables(
+        adapter,
+        table_names,
+        dry_run=False,
+        max_parallel=max_parallel,
+        skip_table_owner=True,
+    )
     adapter.delete_schema(schema_full_name, force=force_schema_delete)
 
     return {
@@ -119,7 +213,7 @@ def delete_schema_with_tables(
     }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UCOwnerChangeResult:
     """Result of an ownership change action for a UC object (table/schema)."""
 
@@ -129,7 +223,7 @@ class UCOwnerChangeResult:
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UCSchemaDropResult:
     """Result of dropping a UC schema."""
 
@@ -138,59 +232,127 @@ class UCSchemaDropResult:
     error: str | None = None
 
 
+def _set_table_owner(adapter, full_name: str, owner: str) -> UCOwnerChangeResult:
+    """Set the owner of a single table, capturing any error."""
+    try:
+        adapter.set_table_owner(full_name=full_name, owner=owner)
+        return UCOwnerChangeResult(full_name=full_name, new_owner=owner, ok=True)
+    except Exception as e:  # noqa: BLE001
+        return UCOwnerChangeResult(
+            full_name=full_name, new_owner=owner, ok=False, error=str(e)
+        )
+
+
 def set_tables_owner(
     adapter,
     table_full_names: Iterable[str],
     owner: str,
     *,
     dry_run: bool,
+    max_parallel: int = 8,
 ) -> list[UCOwnerChangeResult]:
-    """Set the owner of one or more Unity Catalog tables."""
-    results: list[UCOwnerChangeResult] = []
-    for full_name in table_full_names:
-        if dry_run:
-            results.append(
-                UCOwnerChangeResult(full_name=full_name, new_owner=owner, ok=True)
-            )
-            continue
-        try:
-            adapter.set_table_owner(full_name=full_name, owner=owner)
-            results.append(
-                UCOwnerChangeResult(full_name=full_name, new_owner=owner, ok=True)
-            )
-        except Exception as e:  # noqa: BLE001
-            results.append(
-                UCOwnerChangeResult(
-                    full_name=full_name, new_owner=owner, ok=False, error=str(e)
-                )
+    """Set the owner of one or more Unity Catalog tables.
+
+    Tables are processed concurrently (up to `max_parallel` at a time).
+    Results are returned in the same order as `table_full_names`.
+    """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
+
+    if dry_run:
+        return [
+            UCOwnerChangeResult(full_name=full_name, new_owner=owner, ok=True)
+            for full_name in table_full_names
+        ]
+    names = list(table_full_names)
+    if not names:
+        return []
+
+    workers = min(max_parallel, len(names))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                lambda full_name: _set_table_owner(adapter, full_name, owner), names
             )
-    return results
+        )
 
 
-def find_empty_schemas(
+def iter_empty_schemas(
     adapter,
     catalog: str,
     *,
-    name_regex: str | None = None,
-) -> list[str]:
-    """Return schema full names (catalog.schema) that currently contain zero tables."""
-    rx = re.compile(name_regex) if name_regex else None
-    empty: list[str] = []
+    name_regex: str | re.Pattern | None = None,
+    max_parallel: int = 8,
+) -> Iterator[str]:
+    """Yield schema full names (catalog.schema) that currently contain zero tables.
+
+    `name_regex` may be a pattern string or an already compiled pattern.
+    Schemas are listed up front, then probed concurrently (up to
+    `max_parallel` at a time); each empty schema is yielded as soon as its
+    probe and those before it finish, keeping listing order, so a consumer
+    such as `drop_empty_schemas` can start before every probe completes.
+    """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
 
-    schemas = adapter.list_schemas(catalog=catalog)
-    for s in schemas:
+    if isinstance(name_regex, str):
+        rx = compile_pattern(name_regex) if name_regex else None
+    else:
+        rx = name_regex
+    search = matcher(rx) if rx else None
+
+    candidates: list[tuple[str, str]] = []
+    for s in adapter.list_schemas(catalog=catalog):
         schema_name = getattr(s, "name", None)
         schema_full_name = getattr(s, "full_name", None)
         if not schema_name or not schema_full_name:
             continue
-        if rx and not rx.search(schema_full_name):
+        if search and not search(schema_full_name):
             continue
+        candidates.append((schema_name, schema_full_name))
+
+    if not candidates:
+        return iter(())
+    return _probe_empty_schemas(adapter, catalog, candidates, max_parallel)
+
+
+def _probe_empty_schemas(
+    adapter,
+    catalog: str,
+    candidates: list[tuple[str, str]],
+    max_parallel: int,
+) -> Iterator[str]:
+    """Probe candidates on a thread pool, yielding empty schemas in order."""
+    pool = ThreadPoolExecutor(max_workers=min(max_parallel, len(candidates)))
+    try:
+        has_tables = pool.map(
+            lambda c: adapter.schema_has_tables(catalog=catalog, schema=c[0]),
+            candidates,
+        )
+        for (_, full_name), non_empty in zip(candidates, has_tables):
+            if not non_empty:
+                yield full_name
+    finally:
+        # Stop queued probes if the consumer stops early.
+        pool.shutdown(wait=True, cancel_futures=True)
 
-        tables = adapter.list_tables(catalog=catalog, schema=schema_name)
-        if len(tables) == 0:
-            empty.append(schema_full_name)
 
-    return empty
+def find_empty_schemas(
+    adapter,
+    catalog: str,
+    *,
+    name_regex: str | re.Pattern | None = None,
+    max_parallel: int = 8,
+) -> list[str]:
+    """Return schema full names (catalog.schema) that currently contain zero tables.
+
+    Materialized form of `iter_empty_schemas`.
+    """
+    return list(
+        iter_empty_schemas(
+            adapter, catalog, name_regex=name_regex, max_parallel=max_parallel
+        )
+    )
 
 
 def drop_empty_schemas(
@@ -200,7 +362,11 @@ def drop_empty_schemas(
     force: bool = False,
     dry_run: bool,
 ) -> list[UCSchemaDropResult]:
-    """Drop schemas that are already empty (owner will be set to current user first)."""
+    """Drop schemas that are already empty (owner will be set to current user first).
+
+    `schema_full_names` is consumed lazily, so it may be fed directly from
+    `iter_empty_schemas`.
+    """
     me = adapter.current_username() if not dry_run else None
     results: list[UCSchemaDropResult] = []
 
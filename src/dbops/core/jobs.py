@@ -11,11 +11,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Mapping, Protocol
+from itertools import islice
+from typing import Iterator, Mapping, Protocol
 from dbops.core.selectors import JobSelector
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Job:
     """
     Represents a Databricks job.
@@ -32,7 +33,7 @@ class Job:
     tags: Mapping[str, str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRun:
     """
     Represents a single execution (run) of a Databricks job.
@@ -67,6 +68,12 @@ class RunStatus(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Statuses after which a run no longer changes.
+TERMINAL_RUN_STATUSES: frozenset[RunStatus] = frozenset(
+    {RunStatus.SUCCESS, RunStatus.FAILED, RunStatus.CANCELED}
+)
+
+
 class JobsAdapter(Protocol):
     """Interface for job lookup operations used by the core domain."""
 
@@ -74,20 +81,33 @@ class JobsAdapter(Protocol):
         """Return all jobs visible to the current principal."""
         ...
 
+    def iter_all_jobs(self) -> Iterator[Job]:
+        """Yield all jobs visible to the current principal."""
+        ...
+
 
-def select_jobs(adapter: JobsAdapter, selector: JobSelector) -> list[Job]:
+def select_jobs(
+    adapter: JobsAdapter,
+    selector: JobSelector,
+    *,
+    limit: int | None = None,
+) -> list[Job]:
     """
     Select jobs using a selector strategy.
 
     The selector encapsulates matching logic (for example name-based,
-    tag-based, or combined selectors). This function iterates over all
-    available jobs and applies the selector to each job.
+    tag-based, or combined selectors). This function compiles the selector
+    into a single predicate once and applies it to jobs as the adapter
+    streams them.
 
     Args:
         adapter: Databricks jobs adapter used to retrieve all jobs.
         selector: JobSelector instance defining the matching strategy.
+        limit: Optional maximum number of matches; listing stops once reached.
 
     Returns:
         A list of Job objects that match the selector.
     """
-    return [job for job in adapter.find_all_jobs() if selector.matches(job)]
+    predicate = selector.compile()
+    matches = (job for job in adapter.iter_all_jobs() if predicate(job))
+    return list(islice(matches, limit))
@@ -0,0 +1,120 @@
+"""Shared regular expression helpers.
+
+User-supplied patterns (job names, table names, schema names) are compiled
+through a single cached helper so that repeated selectors and filters built
+from the same pattern string reuse one compiled object instead of re-parsing
+it on every call.
+
+Patterns are compiled with Python's `re` module by default. Set
+`DBOPS_REGEX_ENGINE=re2` to opt in to RE2 (from the optional `google-re2`
+package), which matches in linear time and is immune to catastrophic
+backtracking. RE2 syntax differs from `re` in places (for example `a{,3}`
+or `[[:alpha:]]`), so the same pattern can select different objects; it is
+therefore never enabled implicitly. Patterns RE2 does not support (for
+example lookarounds or backreferences) fall back to `re`. RE2 character
+classes are ASCII-only, so it is only used for patterns compiled with
+`re.ASCII`.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:  # optional dependency
+    re2 = None
+
+_REGEX_ENGINE_ENV = "DBOPS_REGEX_ENGINE"
+_REGEX_ENGINES = frozenset({"re", "re2"})
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _regex_engine() -> str:
+    """Return the configured regex engine ("re" or "re2")."""
+    engine = os.getenv(_REGEX_ENGINE_ENV, "re").strip().lower()
+    return engine if engine in _REGEX_ENGINES else "re"
+
+
+def _compile_re2(pattern: str):
+    """Compile with RE2, returning None if RE2 is unavailable or rejects the pattern."""
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.log_errors = False
+    try:
+        return re2.compile(pattern, options=options)
+    except re2.error:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(pattern: str, flags: int, engine: str) -> re.Pattern:
+    """Compile `pattern` with the given engine (memoized by `compile_pattern`)."""
+    # RE2 character classes are ASCII-only, so only ASCII-mode patterns use it.
+    if engine == "re2" and flags == re.ASCII:
+        compiled = _compile_re2(pattern)
+        if compiled is not None:
+            return compiled
+    return re.compile(pattern, flags)
+
+
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regular expression, caching the result by pattern string.
+
+    The returned object exposes the `re.Pattern` matching API (`search`,
+    `match`, `fullmatch`, `pattern`), whether it was built by RE2 or `re`.
+    The engine is chosen by `DBOPS_REGEX_ENGINE`: `re` (default) always
+    uses Python's `re`; `re2` uses RE2 when it is installed and `flags` is
+    exactly `re.ASCII`, falling back to `re` otherwise.
+
+    Args:
+        pattern: Regular expression source.
+        flags: `re` flags. Anything other than `re.ASCII` always uses `re`.
+
+    Returns:
+        The compiled pattern.
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression.
+    """
+    return _compile_cached(pattern, flags, _regex_engine())
+
+
+def is_literal_pattern(pattern: str) -> bool:
+    """Return True if the pattern has no regex metacharacters (plain substring)."""
+    return _REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
+def _is_fully_anchored(pattern: str) -> bool:
+    """Return True if `^...$` anchor the whole pattern (no top-level `|`)."""
+    return (
+        pattern.startswith("^")
+        and pattern.endswith("$")
+        and not pattern.endswith("\\$")
+        and "|" not in pattern
+    )
+
+
+def matcher(compiled: re.Pattern) -> Callable[[str], object]:
+    """
+    Return the cheapest callable equivalent to `compiled.search`.
+
+    Patterns anchored at both ends (`^...$`) can only match the whole
+    string, so `fullmatch` is returned for them; it fails fast instead of
+    retrying the match at every offset. Object names never contain
+    newlines, so `$` matching before a trailing newline does not matter.
+
+    Args:
+        compiled: Pattern returned by `compile_pattern` (RE2 or `re`).
+
+    Returns:
+        A function taking a string and returning a match object or None.
+    """
+    if _is_fully_anchored(compiled.pattern):
+        return compiled.fullmatch
+    return compiled.search
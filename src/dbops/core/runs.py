@@ -7,11 +7,16 @@ with Databricks while keeping concurrency and polling behavior explicit
 and predictable.
 """
 
+import random
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol
 
-from dbops.core.jobs import JobRun, RunStatus
+from dbops.core.jobs import TERMINAL_RUN_STATUSES, JobRun, RunStatus
+
+# Random +/- spread applied to each poll wait so runs started together do
+# not hit the API in lockstep.
+_POLL_JITTER = 0.2
 
 
 class JobRunsAdapter(Protocol):
@@ -44,51 +49,48 @@ def start_jobs_parallel(
         max_parallel: Maximum number of jobs to start concurrently.
 
     Returns:
-        A list of JobRun objects representing the started job runs.
-        The order of the returned runs is not guaranteed.
+        A list of JobRun objects representing the started job runs,
+        in the same order as `job_ids`.
     """
     if max_parallel < 1:
         raise ValueError("max_parallel must be >= 1")
     if not job_ids:
         return []
 
-    runs: list[JobRun] = []
-
     with ThreadPoolExecutor(max_workers=max_parallel) as pool:
-        futures = [pool.submit(adapter.start_job, job_id) for job_id in job_ids]
-
-        for f in as_completed(futures):
-            runs.append(f.result())
-
-    return runs
+        return list(pool.map(adapter.start_job, job_ids))
 
 
 def wait_for_run(
     adapter: JobRunsAdapter,
     run_id: int,
     poll_interval: int = 5,
+    max_poll_interval: int = 30,
 ) -> RunStatus:
     """
     Block until a Databricks job run reaches a terminal state.
 
-    This function polls the Databricks API at a fixed interval until the
-    run reaches a terminal status (SUCCESS, FAILED, or CANCELED).
+    This function polls `get_run_status` until the run reaches a terminal
+    status (SUCCESS, FAILED, or CANCELED). The wait between status checks
+    starts at `poll_interval` and grows by 50% after every check, capped at
+    `max_poll_interval`, so long-running jobs are polled less often. Each
+    wait is jittered by +/-20% so runs started together do not poll in
+    lockstep.
 
     Args:
         adapter: Databricks jobs adapter used to query run status.
         run_id: Identifier of the Databricks job run to monitor.
-        poll_interval: Time in seconds to wait between status checks.
+        poll_interval: Initial time in seconds to wait between status checks.
+        max_poll_interval: Upper bound in seconds for the wait between checks.
 
     Returns:
         The final RunStatus of the job run.
     """
+    interval = float(poll_interval)
     while True:
         status = adapter.get_run_status(run_id)
-        if status in {
-            RunStatus.SUCCESS,
-            RunStatus.FAILED,
-            RunStatus.CANCELED,
-        }:
+        if status in TERMINAL_RUN_STATUSES:
             return status
 
-        time.sleep(poll_interval)
+        time.sleep(interval * random.uniform(1 - _POLL_JITTER, 1 + _POLL_JITTER))
+        interval = min(interval * 1.5, max_poll_interval)
@@ -14,7 +14,9 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
+
+from dbops.core.patterns import compile_pattern, matcher
 
 if TYPE_CHECKING:
     from dbops.core.jobs import Job
@@ -26,8 +28,17 @@ class JobSelector(ABC):
 
     A JobSelector encapsulates a single piece of matching logic that
     determines whether a given Job satisfies a specific criterion.
+
+    Attributes:
+        cost: Relative cost of evaluating the selector. Composite selectors
+              run cheaper children first so expensive checks are skipped
+              more often.
     """
 
+    __slots__ = ()
+
+    cost: int = 100
+
     @abstractmethod
     def matches(self, job: Job) -> bool:
         """
@@ -41,6 +52,18 @@ class JobSelector(ABC):
         """
         ...
 
+    def compile(self) -> Callable[[Job], bool]:
+        """
+        Return a standalone predicate equivalent to `matches`.
+
+        Subclasses override this to capture their state in closure locals,
+        so filtering many jobs avoids per-call attribute and method lookups.
+
+        Returns:
+            A callable taking a Job and returning True if it matches.
+        """
+        return self.matches
+
 
 class NameRegexSelector(JobSelector):
     """
@@ -48,6 +71,10 @@ class NameRegexSelector(JobSelector):
     to the job name.
     """
 
+    __slots__ = ("_search", "regex")
+
+    cost = 10
+
     def __init__(self, pattern: str):
         """
         Create a name-based regex selector.
@@ -56,15 +83,25 @@ class NameRegexSelector(JobSelector):
             pattern: Regular expression pattern used to match job names.
         """
         try:
-            self.regex = re.compile(pattern)
+            self.regex = compile_pattern(pattern)
         except re.error as exc:
             raise ValueError(f"Invalid regex expression: {exc}") from exc
+        self._search = matcher(self.regex)
 
     def matches(self, job: Job) -> bool:
         """
         Check whether the job name matches the configured regex pattern.
         """
-        return bool(self.regex.search(job.name))
+        return self._search(job.name) is not None
+
+    def compile(self) -> Callable[[Job], bool]:
+        """Return a predicate that searches the job name with the compiled regex."""
+        search = self._search
+
+        def predicate(job: Job) -> bool:
+            return search(job.name) is not None
+
+        return predicate
 
 
 class TagSelector(JobSelector):
@@ -72,6 +109,10 @@ class TagSelector(JobSelector):
     Selector that matches jobs based on a specific tag key-value pair.
     """
 
+    __slots__ = ("key", "value")
+
+    cost = 1
+
     def __init__(self, key: str, value: str):
         """
         Create a tag-based selector.
@@ -87,9 +128,19 @@ class TagSelector(JobSelector):
         """
         Check whether the job contains the specified tag with the expected value.
         """
-        if not job.tags:
-            return False
-        return job.tags.get(self.key) == self.value
+        tags = job.tags
+        return tags is not None and tags.get(self.key) == self.value
+
+    def compile(self) -> Callable[[Job], bool]:
+        """Return a predicate that checks the tag value with captured key/value."""
+        key = self.key
+        value = self.value
+
+        def predicate(job: Job) -> bool:
+            tags = job.tags
+            return tags is not None and tags.get(key) == value
+
+        return predicate
 
 
 class AndSelector(JobSelector):
@@ -97,20 +148,42 @@ class AndSelector(JobSelector):
     Composite selector that matches a job only if all child selectors match.
     """
 
+    __slots__ = ("cost", "selectors")
+
     def __init__(self, selectors: list[JobSelector]):
         """
         Create a logical AND selector.
 
+        Children are evaluated cheapest first (by `cost`); the result is the
+        same in any order since selectors are side-effect free.
+
         Args:
             selectors: List of selectors that must all match.
         """
-        self.selectors = selectors
+        self.selectors = tuple(sorted(selectors, key=lambda s: s.cost))
+        # Worst case evaluates every child; lets nested composites sort too.
+        self.cost = sum(s.cost for s in self.selectors)
 
     def matches(self, job: Job) -> bool:
         """
         Check whether all child selectors match the job.
         """
-        return all(s.matches(job) for s in self.selectors)
+        for s in self.selectors:
+            if not s.matches(job):
+                return False
+        return True
+
+    def compile(self) -> Callable[[Job], bool]:
+        """Return a short-circuiting predicate over the compiled child predicates."""
+        predicates = tuple(s.compile() for s in self.selectors)
+
+        def predicate(job: Job) -> bool:
+            for p in predicates:
+                if not p(job):
+                    return False
+            return True
+
+        return predicate
 
 
 class OrSelector(JobSelector):
@@ -118,17 +191,38 @@ class OrSelector(JobSelector):
     Composite selector that matches a job if any child selector matches.
     """
 
+    __slots__ = ("cost", "selectors")
+
     def __init__(self, selectors: list[JobSelector]):
         """
         Create a logical OR selector.
 
+        Children are evaluated cheapest first (by `cost`), so a cheap match
+        skips the more expensive checks; the result is the same in any order.
+
         Args:
             selectors: List of selectors where at least one must match.
         """
-        self.selectors = selectors
+        self.selectors = tuple(sorted(selectors, key=lambda s: s.cost))
+        self.cost = sum(s.cost for s in self.selectors)
 
     def matches(self, job: Job) -> bool:
         """
         Check whether any child selector matches the job.
         """
-        return any(s.matches(job) for s in self.selectors)
+        for s in self.selectors:
+            if s.matches(job):
+                return True
+        return False
+
+    def compile(self) -> Callable[[Job], bool]:
+        """Return a short-circuiting predicate over the compiled child predicates."""
+        predicates = tuple(s.compile() for s in self.selectors)
+
+        def predicate(job: Job) -> bool:
+            for p in predicates:
+                if p(job):
+                    return True
+            return False
+
+        return predicate
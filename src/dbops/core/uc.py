@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UCTable:
     """Lightweight representation of a Unity Catalog table."""
 
@@ -18,7 +18,7 @@ class UCTable:
     table_type: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UCCatalog:
     """Lightweight representation of a Unity Catalog catalog."""
 
@@ -26,7 +26,7 @@ class UCCatalog:
     owner: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UCSchema:
     """Lightweight representation of a Unity Catalog schema."""
 
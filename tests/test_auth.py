@@ -0,0 +1,44 @@
+import pytest
+
+from dbops.core import auth
+from dbops.core.auth import AuthError, get_client
+
+
+class _Config:
+    def __init__(self, profile=None):
+        if profile == "broken":
+            raise ValueError("no such profile")
+        self.profile = profile
+        self.host = "https://example.cloud.databricks.com/?o=123"
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    monkeypatch.setattr("databricks.sdk.core.Config", _Config)
+    monkeypatch.setattr("databricks.sdk.WorkspaceClient", lambda config: config)
+
+
+def test_get_client_sanitizes_host(fake_sdk):
+    client = get_client("dev")
+
+    assert client.profile == "dev"
+    assert client.host == "https://example.cloud.databricks.com"
+
+
+def test_get_client_raises_auth_error_for_unknown_profile(fake_sdk):
+    with pytest.raises(AuthError, match="no such profile"):
+        get_client("broken")
+
+
+def test_format_auth_error_suggests_login_for_refresh_token_errors():
+    message = (
+        "invalid refresh token. Run the following command: "
+        "databricks auth login --host https://example.cloud.databricks.com"
+    )
+
+    assert "$ databricks auth login --profile dev" in auth._format_auth_error(
+        message, "dev"
+    )
+    assert auth._format_auth_error("boom", None) == (
+        "Databricks authentication failed: boom"
+    )
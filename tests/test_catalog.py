@@ -1,13 +1,21 @@
+import re
+import threading
 from types import SimpleNamespace
+from typing import Iterator
 
 import pytest
 
 from dbops.core.catalog import (
+    UCTableDeleteResult,
     delete_schema_with_tables,
     delete_tables,
     drop_empty_schemas,
+    filter_tables,
+    filter_tables_iter,
     find_empty_schemas,
+    iter_empty_schemas,
     parse_schema_full_name,
+    set_tables_owner,
 )
 from dbops.core.uc import UCTable
 
@@ -79,17 +87,17 @@ def test_delete_schema_with_tables_returns_table_results():
         def __init__(self):
             self.schema_owner_set: list[tuple[str, str]] = []
             self.schema_deleted: list[tuple[str, bool]] = []
+            self.username_lookups = 0
 
         def current_username(self) -> str:
+            self.username_lookups += 1
             return "me@example.com"
 
-        def list_tables(self, *, catalog: str, schema: str) -> list[UCTable]:
+        def iter_tables(self, *, catalog: str, schema: str) -> Iterator[UCTable]:
             assert catalog == "main"
             assert schema == "sales"
-            return [
-                UCTable(full_name="main.sales.good"),
-                UCTable(full_name="main.sales.bad"),
-            ]
+            yield UCTable(full_name="main.sales.good")
+            yield UCTable(full_name="main.sales.bad")
 
         def set_schema_owner(self, schema_full_name: str, owner: str) -> None:
             self.schema_owner_set.append((schema_full_name, owner))
@@ -118,6 +126,87 @@ def test_delete_schema_with_tables_returns_table_results():
     assert any(getattr(r, "error", None) for r in table_results)
     assert adapter.schema_owner_set == [("main.sales", "me@example.com")]
     assert adapter.schema_deleted == [("main.sales", False)]
+    assert adapter.username_lookups == 1
+
+
+def test_delete_schema_with_tables_uses_pre_resolved_tables():
+    class _Adapter:
+        def __init__(self):
+            self.deleted: list[str] = []
+
+        def current_username(self) -> str:
+            return "me@example.com"
+
+        def iter_tables(self, *, catalog: str, schema: str) -> Iterator[UCTable]:
+            raise AssertionError("tables should not be listed again")
+
+        def set_schema_owner(self, schema_full_name: str, owner: str) -> None:
+            return None
+
+        def set_table_owner(self, full_name: str, owner: str) -> None:
+            raise AssertionError("schema ownership covers its tables")
+
+        def delete_table(self, full_name: str) -> None:
+            self.deleted.append(full_name)
+
+        def delete_schema(self, schema_full_name: str, force: bool = False) -> None:
+            return None
+
+    adapter = _Adapter()
+    result = delete_schema_with_tables(
+        adapter,
+        schema_full_name="main.sales",
+        pre_resolved_tables=["main.sales.a"],
+    )
+
+    assert result["tables"] == ["main.sales.a"]
+    assert adapter.deleted == ["main.sales.a"]
+    assert result["table_results"] == [
+        UCTableDeleteResult(table="main.sales.a", owner_set=False, deleted=True)
+    ]
+
+
+def test_delete_schema_with_tables_cascade_drops_schema_in_one_call():
+    class _Adapter:
+        def __init__(self):
+            self.calls: list[tuple] = []
+
+        def current_username(self) -> str:
+            return "me@example.com"
+
+        def iter_tables(self, *, catalog: str, schema: str) -> Iterator[UCTable]:
+            raise AssertionError("cascade should not list tables")
+
+        def set_schema_owner(self, schema_full_name: str, owner: str) -> None:
+            self.calls.append(("owner", schema_full_name, owner))
+
+        def delete_table(self, full_name: str) -> None:
+            raise AssertionError("cascade should not delete tables one by one")
+
+        def delete_schema(self, schema_full_name: str, force: bool = False) -> None:
+            self.calls.append(("delete", schema_full_name, force))
+
+    adapter = _Adapter()
+    result = delete_schema_with_tables(adapter, "main.sales", cascade=True)
+
+    assert adapter.calls == [
+        ("owner", "main.sales", "me@example.com"),
+        ("delete", "main.sales", True),
+    ]
+    assert result["table_results"] == []
+    assert result["schema_deleted"] is True
+
+
+def test_delete_schema_with_tables_cascade_rejects_table_filter():
+    with pytest.raises(ValueError, match="cascade"):
+        delete_schema_with_tables(
+            object(), "main.sales", table_name_regex="tmp_", cascade=True
+        )
+
+
+def test_delete_schema_with_tables_rejects_non_positive_parallel():
+    with pytest.raises(ValueError, match="max_parallel"):
+        delete_schema_with_tables(object(), "main.sales", max_parallel=0)
 
 
 def test_find_empty_schemas_filters_on_regex():
@@ -129,10 +218,8 @@ def test_find_empty_schemas_filters_on_regex():
                 SimpleNamespace(name="prod_a", full_name="main.prod_a"),
             ]
 
-        def list_tables(self, *, catalog: str, schema: str):
-            if schema == "tmp_a":
-                return []
-            return [SimpleNamespace(full_name=f"{catalog}.{schema}.t1")]
+        def schema_has_tables(self, *, catalog: str, schema: str) -> bool:
+            return schema != "tmp_a"
 
     adapter = _Adapter()
     assert find_empty_schemas(adapter, catalog="main", name_regex=r"^main\.tmp") == [
@@ -140,6 +227,47 @@ def test_find_empty_schemas_filters_on_regex():
     ]
 
 
+def test_iter_empty_schemas_feeds_drop_empty_schemas_lazily():
+    class _Adapter:
+        def __init__(self):
+            self.events: list[str] = []
+            self.first_drop = threading.Event()
+            self.lock = threading.Lock()
+
+        def list_schemas(self, *, catalog: str):
+            return [
+                SimpleNamespace(name=f"s{i}", full_name=f"main.s{i}") for i in range(6)
+            ]
+
+        def schema_has_tables(self, *, catalog: str, schema: str) -> bool:
+            if schema == "s5":
+                # The last probe only finishes once a drop has started.
+                self.first_drop.wait(timeout=5)
+            with self.lock:
+                self.events.append(f"probe:{schema}")
+            return schema in {"s1", "s4"}
+
+        def current_username(self) -> str:
+            return "me@example.com"
+
+        def set_schema_owner(self, schema_full_name: str, owner: str) -> None:
+            return None
+
+        def delete_schema(self, schema_full_name: str, force: bool = False) -> None:
+            with self.lock:
+                self.events.append(f"drop:{schema_full_name}")
+            self.first_drop.set()
+
+    adapter = _Adapter()
+    empties = iter_empty_schemas(adapter, "main", max_parallel=3)
+    results = drop_empty_schemas(adapter, empties, dry_run=False)
+
+    drops = [e for e in adapter.events if e.startswith("drop:")]
+    assert drops == ["drop:main.s0", "drop:main.s2", "drop:main.s3", "drop:main.s5"]
+    assert adapter.events.index(drops[0]) < adapter.events.index("probe:s5")
+    assert all(r.ok for r in results)
+
+
 def test_drop_empty_schemas_dry_run_skips_owner_lookup():
     class _Adapter:
         def __init__(self):
@@ -162,3 +290,73 @@ def test_drop_empty_schemas_dry_run_skips_owner_lookup():
     assert len(results) == 1
     assert results[0].schema_full_name == "main.s1"
     assert results[0].ok is True
+
+
+def test_delete_tables_parallel_preserves_input_order():
+    class _Adapter:
+        def current_username(self) -> str:
+            return "me@example.com"
+
+        def set_table_owner(self, full_name: str, owner: str) -> None:
+            return None
+
+        def delete_table(self, full_name: str) -> None:
+            return None
+
+    names = [f"main.sales.t{i}" for i in range(20)]
+    results = delete_tables(_Adapter(), names, max_parallel=4)
+
+    assert [r.table for r in results] == names
+    assert all(r.deleted for r in results)
+
+
+def test_delete_tables_rejects_non_positive_parallel():
+    with pytest.raises(ValueError, match="max_parallel"):
+        delete_tables(object(), ["main.sales.t1"], max_parallel=0)
+
+
+def test_filter_tables_literal_and_regex_patterns():
+    tables = [UCTable(full_name="main.sales.tmp_a"), UCTable(full_name="main.sales.b")]
+
+    assert [t.full_name for t in filter_tables(tables, "tmp_")] == ["main.sales.tmp_a"]
+    assert [t.full_name for t in filter_tables(tables, r"\.b$")] == ["main.sales.b"]
+    assert [t.full_name for t in filter_tables(tables, re.compile(r"tmp"))] == [
+        "main.sales.tmp_a"
+    ]
+
+
+def test_filter_tables_accepts_streamed_tables():
+    tables = [UCTable(full_name="main.sales.tmp_a"), UCTable(full_name="main.sales.b")]
+
+    assert filter_tables(iter(tables), None) == tables
+    assert [t.full_name for t in filter_tables(iter(tables), "tmp_")] == [
+        "main.sales.tmp_a"
+    ]
+
+
+def test_set_tables_owner_parallel_preserves_order_and_errors():
+    class _Adapter:
+        def set_table_owner(self, full_name: str, owner: str) -> None:
+            if full_name.endswith("t3"):
+                raise RuntimeError("denied")
+
+    names = [f"main.sales.t{i}" for i in range(10)]
+    results = set_tables_owner(_Adapter(), names, "ops", dry_run=False, max_parallel=4)
+
+    assert [r.full_name for r in results] == names
+    assert [r.full_name for r in results if not r.ok] == ["main.sales.t3"]
+    assert results[3].error == "denied"
+
+
+def test_filter_tables_iter_is_lazy():
+    consumed: list[str] = []
+
+    def _stream():
+        for name in ("main.sales.tmp_a", "main.sales.b", "main.sales.tmp_c"):
+            consumed.append(name)
+            yield UCTable(full_name=name)
+
+    matches = filter_tables_iter(_stream(), "tmp_")
+
+    assert next(matches).full_name == "main.sales.tmp_a"
+    assert consumed == ["main.sales.tmp_a"]
@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from dbops.cli import app
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_root_help_does_not_import_subcommands():
+    code = (
+        "import sys\n"
+        "from dbops.cli import app\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = [m for m in sys.modules if m.startswith("
+        "('databricks.sdk', 'dbops.cli.commands'))]\n"
+        "print(loaded, file=sys.stderr)\n"
+        "sys.exit(1 if loaded else 0)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=False,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC), "COLUMNS": "120"},
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "jobs" in result.stdout
+    assert "uc" in result.stdout
+
+
+def test_subcommand_help_loads_group_on_demand():
+    result = CliRunner().invoke(app, ["uc", "--help"])
+
+    assert result.exit_code == 0
+    assert "tables-delete" in result.stdout
+
+
+def test_banner_is_skipped_when_stdout_is_not_a_terminal(monkeypatch, capsys):
+    from dbops.cli.common import banner
+
+    banner.opt_print_banner.cache_clear()
+    monkeypatch.setattr(sys, "argv", ["dbops", "--help"])
+    monkeypatch.setattr("sys.stdout.isatty", lambda: False)
+
+    banner.opt_print_banner()
+
+    assert capsys.readouterr().out == ""
+
+
+def test_piped_listing_writes_only_rows_to_stdout(monkeypatch):
+    from types import SimpleNamespace
+
+    from dbops.cli.common import context
+    from dbops.core.adapters.unitycatalog import UnityCatalogAdapter
+
+    monkeypatch.delenv("DBOPS_OUTPUT", raising=False)
+    monkeypatch.setattr(context, "get_client", lambda profile: object())
+    monkeypatch.setattr(
+        UnityCatalogAdapter,
+        "list_catalogs",
+        lambda self: [
+            SimpleNamespace(name="main", owner="me"),
+            SimpleNamespace(name="dev", owner=None),
+        ],
+    )
+
+    result = CliRunner().invoke(app, ["uc", "catalogs-list"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "main\tme\ndev\t\n"
+    assert "Catalogs: 2" in result.stderr
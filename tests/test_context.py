@@ -0,0 +1,36 @@
+import pytest
+
+from dbops.cli.common import context
+from dbops.cli.common.context import build_jobs_context, build_uc_context
+
+
+@pytest.fixture
+def client_calls(monkeypatch):
+    calls = []
+
+    def fake_get_client(profile):
+        calls.append(profile)
+        return object()
+
+    monkeypatch.setattr(context, "get_client", fake_get_client)
+    return calls
+
+
+def test_build_uc_context_returns_fresh_context(client_calls):
+    first = build_uc_context("dev")
+    second = build_uc_context("dev")
+
+    assert second is not first
+    assert first.adapter is first.adapter
+    assert client_calls == ["dev"]
+
+
+def test_contexts_create_client_lazily(client_calls):
+    uc_ctx = build_uc_context("dev")
+    jobs_ctx = build_jobs_context("dev", refresh_jobs=True)
+
+    assert client_calls == []
+    assert jobs_ctx.adapter is jobs_ctx.adapter
+    assert client_calls == ["dev"]
+    assert uc_ctx.client is uc_ctx.client
+    assert client_calls == ["dev", "dev"]
@@ -0,0 +1,33 @@
+from dbops.core.jobs import Job, select_jobs
+from dbops.core.selectors import NameRegexSelector
+
+
+class _JobsAdapterStub:
+    def __init__(self, jobs: list[Job]):
+        self.jobs = jobs
+        self.yielded = 0
+
+    def find_all_jobs(self) -> list[Job]:
+        return list(self.iter_all_jobs())
+
+    def iter_all_jobs(self):
+        for job in self.jobs:
+            self.yielded += 1
+            yield job
+
+
+def test_select_jobs_filters_with_selector():
+    adapter = _JobsAdapterStub(
+        [Job(id=1, name="daily-etl"), Job(id=2, name="weekly-etl")]
+    )
+
+    assert [j.id for j in select_jobs(adapter, NameRegexSelector("daily"))] == [1]
+
+
+def test_select_jobs_limit_stops_listing_early():
+    adapter = _JobsAdapterStub([Job(id=i, name=f"etl-{i}") for i in range(10)])
+
+    jobs = select_jobs(adapter, NameRegexSelector("etl"), limit=2)
+
+    assert [j.id for j in jobs] == [0, 1]
+    assert adapter.yielded == 2
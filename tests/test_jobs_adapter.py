@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+from databricks.sdk.service.jobs import RunLifeCycleState, RunResultState
+
+from dbops.core.adapters.databricksjobs import DatabricksJobsAdapter
+from dbops.core.jobs import RunStatus
+
+
+class _JobsApi:
+    def __init__(self, states):
+        self.states = list(states)
+        self.get_run_calls = 0
+
+    def get_run(self, run_id):
+        self.get_run_calls += 1
+        return SimpleNamespace(state=self.states.pop(0))
+
+
+def _adapter(jobs_api, tmp_path, monkeypatch) -> DatabricksJobsAdapter:
+    monkeypatch.setenv("DBOPS_CACHE_DIR", str(tmp_path))
+    client = SimpleNamespace(jobs=jobs_api, config=SimpleNamespace(host="h"))
+    return DatabricksJobsAdapter(client, profile="test")
+
+
+def test_get_run_status_caches_terminal_status(tmp_path, monkeypatch):
+    jobs_api = _JobsApi(
+        [
+            SimpleNamespace(
+                result_state=None, life_cycle_state=RunLifeCycleState.RUNNING
+            ),
+            SimpleNamespace(
+                result_state=RunResultState.SUCCESS,
+                life_cycle_state=RunLifeCycleState.TERMINATED,
+            ),
+        ]
+    )
+    adapter = _adapter(jobs_api, tmp_path, monkeypatch)
+
+    assert adapter.get_run_status(7) == RunStatus.RUNNING
+    assert adapter.get_run_status(7) == RunStatus.SUCCESS
+    assert adapter.get_run_status(7) == RunStatus.SUCCESS
+    assert jobs_api.get_run_calls == 2
+
+
+def test_get_run_status_reports_timed_out_run_as_failed(tmp_path, monkeypatch):
+    jobs_api = _JobsApi(
+        [
+            SimpleNamespace(
+                result_state=RunResultState.TIMEDOUT,
+                life_cycle_state=RunLifeCycleState.TERMINATED,
+            )
+        ]
+    )
+    adapter = _adapter(jobs_api, tmp_path, monkeypatch)
+
+    assert adapter.get_run_status(9) == RunStatus.FAILED
+
+
+def test_jobs_cache_round_trips_with_and_without_orjson(tmp_path, monkeypatch):
+    from dbops.core.adapters import databricksjobs
+    from dbops.core.jobs import Job
+
+    jobs = [Job(id=1, name="daily", tags={"env": "prod"}), Job(id=2, name="b", tags={})]
+    for module in (databricksjobs.orjson, None):
+        monkeypatch.setattr(databricksjobs, "orjson", module)
+        adapter = _adapter(_JobsApi([]), tmp_path, monkeypatch)
+
+        adapter._store_cached_jobs(jobs)
+
+        assert adapter._load_cached_jobs() == jobs
+
+
+def test_store_cached_jobs_replaces_file_atomically(tmp_path, monkeypatch):
+    from dbops.core.jobs import Job
+
+    adapter = _adapter(_JobsApi([]), tmp_path, monkeypatch)
+    adapter._cache_path.parent.mkdir(parents=True)
+    adapter._cache_path.write_text("{corrupt")
+
+    adapter._store_cached_jobs([Job(id=1, name="daily", tags={})])
+
+    assert adapter._load_cached_jobs() == [Job(id=1, name="daily", tags={})]
+    assert [p.name for p in adapter._cache_path.parent.iterdir()] == [
+        adapter._cache_path.name
+    ]
+
+
+def test_iter_all_jobs_requests_full_pages(tmp_path, monkeypatch):
+    monkeypatch.setenv("DBOPS_JOBS_CACHE_DISABLE", "1")
+    jobs_api = _JobsApi([])
+    seen_kwargs = []
+
+    def _list(**kwargs):
+        seen_kwargs.append(kwargs)
+        yield SimpleNamespace(job_id=1, settings=SimpleNamespace(name="a", tags=None))
+
+    jobs_api.list = _list
+    adapter = _adapter(jobs_api, tmp_path, monkeypatch)
+
+    assert [job.name for job in adapter.iter_all_jobs()] == ["a"]
+    assert seen_kwargs == [{"limit": 100}]
+
+
+def test_limited_selection_does_not_write_jobs_cache(tmp_path, monkeypatch):
+    from dbops.core.jobs import select_jobs
+    from dbops.core.selectors import NameRegexSelector
+
+    monkeypatch.delenv("DBOPS_JOBS_CACHE_DISABLE", raising=False)
+    jobs_api = _JobsApi([])
+    jobs_api.list = lambda **kwargs: iter(
+        SimpleNamespace(job_id=i, settings=SimpleNamespace(name=f"job_{i}", tags=None))
+        for i in range(3)
+    )
+    adapter = _adapter(jobs_api, tmp_path, monkeypatch)
+
+    assert [
+        job.id for job in select_jobs(adapter, NameRegexSelector("job"), limit=1)
+    ] == [0]
+    assert adapter._load_cached_jobs() is None
+
+    assert len(select_jobs(adapter, NameRegexSelector("job"))) == 3
+    assert [job.id for job in adapter._load_cached_jobs()] == [0, 1, 2]
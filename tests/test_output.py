@@ -0,0 +1,160 @@
+from dbops.cli.common.output import out
+from dbops.core.jobs import JobRun, RunStatus
+from dbops.core.uc import UCTable
+
+
+def test_tables_table_writes_tsv_when_requested(monkeypatch, capsys):
+    monkeypatch.setenv("DBOPS_OUTPUT", "tsv")
+
+    out.tables_table(
+        [UCTable(full_name="main.sales.a", owner="me", table_type="MANAGED"), "main.b"]
+    )
+
+    assert capsys.readouterr().out == "main.sales.a\tMANAGED\tme\nmain.b\t\t\n"
+
+
+def test_schemas_table_uses_rich_when_requested(monkeypatch, capsys):
+    monkeypatch.setenv("DBOPS_OUTPUT", "rich")
+
+    out.schemas_table(["main.sales"], title="Schemas")
+
+    captured = capsys.readouterr().out
+    assert "Schemas" in captured
+    assert "\t" not in captured
+
+
+def test_q_call_drops_undeclared_prompt_kwargs():
+    calls = []
+
+    def prompt(message, *, pointer=None, style=None, **kwargs):
+        calls.append((message, pointer, kwargs))
+        return "answer"
+
+    result = out._q_call(prompt, "Pick", pointer=">", checked_icon="x", style=None)
+
+    assert result == "answer"
+    assert calls == [("Pick", ">", {})]
+
+
+def test_jobs_table_sorts_by_name_and_formats_tags(monkeypatch, capsys):
+    from dbops.core.jobs import Job
+
+    monkeypatch.setenv("DBOPS_OUTPUT", "rich")
+
+    out.jobs_table(
+        [
+            Job(id=2, name="weekly", tags=None),
+            Job(id=1, name="Daily", tags={"env": "prod", "team": "data"}),
+        ]
+    )
+
+    captured = capsys.readouterr().out
+    assert captured.index("Daily") < captured.index("weekly")
+    assert "env=prod, team=data" in captured
+
+
+def test_uc_delete_results_table_renders_flags_and_errors(monkeypatch, capsys):
+    from dbops.core.catalog import UCTableDeleteResult
+
+    monkeypatch.setenv("DBOPS_OUTPUT", "rich")
+
+    out.uc_delete_results_table(
+        [
+            UCTableDeleteResult(table="main.sales.a", owner_set=True, deleted=True),
+            UCTableDeleteResult(
+                table="main.sales.b", owner_set=False, deleted=False, error="boom"
+            ),
+        ]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    row_a = next(line for line in lines if "main.sales.a" in line)
+    row_b = next(line for line in lines if "main.sales.b" in line)
+    assert row_a.count("yes") == 2
+    assert row_b.count("no") == 2
+    assert "boom" in row_b
+
+
+def test_uc_delete_results_table_can_hide_owner_column(monkeypatch, capsys):
+    from dbops.core.catalog import UCTableDeleteResult
+
+    results = [UCTableDeleteResult(table="main.tmp.a", owner_set=False, deleted=True)]
+
+    monkeypatch.setenv("DBOPS_OUTPUT", "rich")
+    out.uc_delete_results_table(results, show_owner=False)
+    captured = capsys.readouterr().out
+    assert "Owner set" not in captured
+    assert " no " not in captured
+
+    monkeypatch.setenv("DBOPS_OUTPUT", "tsv")
+    out.uc_delete_results_table(results, show_owner=False)
+    assert capsys.readouterr().out == "main.tmp.a\tyes\t\n"
+
+
+def test_run_status_table_sorts_by_job_label_and_renders_status(monkeypatch, capsys):
+    monkeypatch.setenv("DBOPS_OUTPUT", "rich")
+    out.run_status_table(
+        [
+            (JobRun(run_id=20, job_id=2), RunStatus.FAILED),
+            (JobRun(run_id=10, job_id=1), RunStatus.SUCCESS),
+        ],
+        job_name_by_id={1: "alpha", 2: "beta"},
+    )
+
+    captured = capsys.readouterr().out
+    assert captured.index("alpha") < captured.index("beta")
+    assert "SUCCESS" in captured
+    assert "FAILED" in captured
+
+
+def test_result_tables_write_tsv_when_piped(monkeypatch, capsys):
+    from dbops.core.catalog import UCTableDeleteResult
+
+    monkeypatch.delenv("DBOPS_OUTPUT", raising=False)
+    monkeypatch.setattr("sys.stdout.isatty", lambda: False)
+
+    out.uc_delete_results_table(
+        [UCTableDeleteResult(table="main.b", owner_set=True, deleted=False, error="x")]
+    )
+    out.run_status_table([(JobRun(run_id=7, job_id=1), RunStatus.SUCCESS)])
+
+    assert capsys.readouterr().out == "main.b\tyes\tno\tx\n1\t7\tSUCCESS\n"
+
+
+def test_tsv_cells_keep_one_row_per_object(monkeypatch, capsys):
+    from dbops.core.catalog import UCSchemaDropResult
+
+    monkeypatch.setenv("DBOPS_OUTPUT", "tsv")
+
+    out.uc_schema_drop_results_table(
+        [
+            UCSchemaDropResult(
+                "main.tmp", ok=False, error="PERMISSION_DENIED:\n\tnot owner\r"
+            ),
+            UCSchemaDropResult("main.old", ok=True),
+        ]
+    )
+
+    assert capsys.readouterr().out == (
+        "main.tmp\tFAIL\tPERMISSION_DENIED:  not owner \nmain.old\tOK\t\n"
+    )
+
+
+def test_uc_owner_and_schema_drop_results_write_tsv(monkeypatch, capsys):
+    from dbops.core.catalog import UCOwnerChangeResult, UCSchemaDropResult
+
+    monkeypatch.setenv("DBOPS_OUTPUT", "tsv")
+
+    out.uc_owner_change_results_table(
+        [
+            UCOwnerChangeResult(full_name="main.s.a", new_owner="ops", ok=True),
+            UCOwnerChangeResult(
+                full_name="main.s.b", new_owner="ops", ok=False, error="denied"
+            ),
+        ]
+    )
+    out.uc_schema_drop_results_table([UCSchemaDropResult("main.tmp", ok=True)])
+
+    assert capsys.readouterr().out == (
+        "main.s.a\tops\tOK\t\nmain.s.b\tops\tFAIL\tdenied\nmain.tmp\tOK\t\n"
+    )
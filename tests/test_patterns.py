@@ -0,0 +1,75 @@
+import re
+
+import pytest
+
+from dbops.core.patterns import compile_pattern, is_literal_pattern, matcher
+
+
+def test_compile_pattern_reuses_compiled_object():
+    assert compile_pattern(r"^daily-") is compile_pattern(r"^daily-")
+
+
+def test_compile_pattern_raises_on_invalid_regex():
+    with pytest.raises(re.error):
+        compile_pattern("(")
+
+
+def test_compile_pattern_supports_lookaround():
+    rx = compile_pattern(r"(?<=main\.)tmp_")
+
+    assert rx.search("main.tmp_a") is not None
+    assert rx.search("dev.tmp_a") is None
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [("tmp_", True), ("sales-2024", True), ("^tmp", False), ("a.b", False)],
+)
+def test_is_literal_pattern(pattern: str, expected: bool):
+    assert is_literal_pattern(pattern) is expected
+
+
+def test_compile_pattern_defaults_to_re_engine(monkeypatch):
+    monkeypatch.delenv("DBOPS_REGEX_ENGINE", raising=False)
+    rx = compile_pattern(r"^a{,3}$", re.ASCII)
+
+    assert isinstance(rx, re.Pattern)
+    assert rx.search("aa") is not None
+
+
+def test_compile_pattern_ascii_flag(monkeypatch):
+    monkeypatch.setenv("DBOPS_REGEX_ENGINE", "re")
+    rx = compile_pattern(r"^\w+$", re.ASCII)
+
+    assert rx.search("sales_2024") is not None
+    assert rx.search("séries") is None
+    assert compile_pattern(r"^\w+$").search("séries") is not None
+
+
+def test_compile_pattern_keeps_unicode_classes_without_ascii_flag(monkeypatch):
+    monkeypatch.setenv("DBOPS_REGEX_ENGINE", "re2")
+
+    assert compile_pattern(r"^\w+$").search("séries") is not None
+    assert compile_pattern(r"^\d+$").search("١٢٣") is not None
+
+
+@pytest.mark.parametrize(
+    ("pattern", "name", "expected"),
+    [
+        ("^job_a$", "job_a", True),
+        ("^job_a$", "job_ab", False),
+        ("^job_a|b$", "job_ax", True),
+        ("^job_a\\$", "job_a$x", True),
+        ("job", "my_job_x", True),
+    ],
+)
+def test_matcher_agrees_with_search(pattern: str, name: str, expected: bool):
+    compiled = compile_pattern(pattern)
+
+    assert (matcher(compiled)(name) is not None) is expected
+    assert (compiled.search(name) is not None) is expected
+
+
+def test_matcher_uses_fullmatch_only_for_fully_anchored_patterns():
+    assert matcher(compile_pattern("^a.*$")) == compile_pattern("^a.*$").fullmatch
+    assert matcher(compile_pattern("^a|b$")) == compile_pattern("^a|b$").search
@@ -1,20 +1,9 @@
-from dbops.cli.common.progress import _display_job_label, _run_display_sort_key
-from dbops.core.jobs import JobRun
-
-
-def test_display_job_label_name_before_id_and_aligned():
-    labels = {
-        1: _display_job_label(1, {1: "alpha_job", 2: "beta"}, name_width=12),
-        2: _display_job_label(2, {1: "alpha_job", 2: "beta"}, name_width=12),
-    }
-
-    assert labels[1].startswith("alpha_job")
-    assert labels[2].startswith("beta")
-    assert labels[1].index("(id: ") == labels[2].index("(id: ")
-
-
-def test_display_job_label_falls_back_to_id_when_name_missing():
-    assert _display_job_label(42, {1: "alpha"}, name_width=10) == "42"
+from dbops.cli.common import progress
+from dbops.cli.common.progress import (
+    _run_display_sort_key,
+    wait_for_runs_with_progress,
+)
+from dbops.core.jobs import JobRun, RunStatus
 
 
 def test_run_display_sort_key_uses_job_name_then_run_id():
@@ -27,3 +16,101 @@ def test_run_display_sort_key_uses_job_name_then_run_id():
 
     sorted_runs = sorted(runs, key=lambda run: _run_display_sort_key(run, names))
     assert [(r.job_id, r.run_id) for r in sorted_runs] == [(2, 20), (3, 30), (1, 10)]
+
+
+def test_wait_for_runs_with_progress_labels_fall_back_to_id(monkeypatch):
+    labels: dict[str, str] = {}
+
+    class _Progress(progress.Progress):
+        def add_task(self, description, **fields):
+            if "job" in fields:
+                labels[fields["run_id"]] = fields["job"]
+            return super().add_task(description, **fields)
+
+    class _Adapter:
+        def get_run_status(self, run_id: int) -> RunStatus:
+            return RunStatus.SUCCESS
+
+    monkeypatch.setattr(progress, "Progress", _Progress)
+    runs = [JobRun(run_id=10, job_id=1), JobRun(run_id=20, job_id=42)]
+
+    wait_for_runs_with_progress(_Adapter(), runs, job_name_by_id={1: "alpha"})
+
+    assert labels["10"].startswith("alpha")
+    assert "(id: 1)" in labels["10"]
+    assert labels["20"] == "42"
+
+
+def test_wait_for_runs_with_progress_polls_until_terminal(monkeypatch):
+    class _Adapter:
+        def __init__(self):
+            self.calls: dict[int, int] = {}
+
+        def get_run_status(self, run_id: int) -> RunStatus:
+            self.calls[run_id] = self.calls.get(run_id, 0) + 1
+            if run_id == 1 or self.calls[run_id] >= 3:
+                return RunStatus.SUCCESS if run_id != 3 else RunStatus.FAILED
+            return RunStatus.RUNNING
+
+    monkeypatch.setattr(progress.time, "sleep", lambda _: None)
+    adapter = _Adapter()
+    runs = [JobRun(run_id=i, job_id=i) for i in (1, 2, 3)]
+
+    results = wait_for_runs_with_progress(adapter, runs, poll_interval=0)
+
+    assert [(r.run_id, st) for r, st in results] == [
+        (1, RunStatus.SUCCESS),
+        (2, RunStatus.SUCCESS),
+        (3, RunStatus.FAILED),
+    ]
+    assert adapter.calls == {1: 1, 2: 3, 3: 3}
+
+
+def test_wait_for_runs_with_progress_backs_off_while_status_unchanged(monkeypatch):
+    class _Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def monotonic(self) -> float:
+            return self.now
+
+        def sleep(self, seconds: float) -> None:
+            self.now += seconds
+
+    class _Adapter:
+        def __init__(self):
+            self.polled_at: list[float] = []
+
+        def get_run_status(self, run_id: int) -> RunStatus:
+            self.polled_at.append(clock.now)
+            return RunStatus.SUCCESS if len(self.polled_at) == 5 else RunStatus.RUNNING
+
+    clock = _Clock()
+    monkeypatch.setattr(progress, "time", clock)
+    adapter = _Adapter()
+
+    wait_for_runs_with_progress(
+        adapter, [JobRun(run_id=1, job_id=1)], poll_interval=2, max_poll_interval=6
+    )
+
+    assert adapter.polled_at == [0, 2, 6, 12, 18]
+
+
+def test_wait_for_runs_with_progress_caps_poll_workers(monkeypatch):
+    pool_sizes: list[int] = []
+    real_pool = progress.ThreadPoolExecutor
+
+    def _pool(max_workers):
+        pool_sizes.append(max_workers)
+        return real_pool(max_workers=max_workers)
+
+    class _Adapter:
+        def get_run_status(self, run_id: int) -> RunStatus:
+            return RunStatus.SUCCESS
+
+    monkeypatch.setattr(progress, "ThreadPoolExecutor", _pool)
+    runs = [JobRun(run_id=i, job_id=i) for i in range(1, 6)]
+
+    wait_for_runs_with_progress(_Adapter(), runs, poll_interval=0, max_parallel=2)
+
+    assert pool_sizes == [2]
@@ -1,7 +1,7 @@
 import pytest
 
-from dbops.core.jobs import JobRun
-from dbops.core.runs import start_jobs_parallel
+from dbops.core.jobs import JobRun, RunStatus
+from dbops.core.runs import start_jobs_parallel, wait_for_run
 
 
 class _RunsAdapterStub:
@@ -18,11 +18,46 @@ def test_start_jobs_parallel_returns_empty_on_empty_input():
     assert start_jobs_parallel(_RunsAdapterStub(), [], 2) == []
 
 
-def test_start_jobs_parallel_starts_all_jobs():
-    runs = start_jobs_parallel(_RunsAdapterStub(), [1, 2, 3], 2)
+def test_start_jobs_parallel_starts_all_jobs_in_input_order():
+    runs = start_jobs_parallel(_RunsAdapterStub(), [3, 1, 2], 2)
 
-    assert sorted((r.job_id, r.run_id) for r in runs) == [
+    assert [(r.job_id, r.run_id) for r in runs] == [
+        (3, 30),
         (1, 10),
         (2, 20),
-        (3, 30),
     ]
+
+
+def test_wait_for_run_backs_off_until_terminal(monkeypatch):
+    statuses = iter(
+        [RunStatus.PENDING, RunStatus.RUNNING, RunStatus.RUNNING, RunStatus.SUCCESS]
+    )
+    sleeps: list[float] = []
+
+    class _Adapter:
+        def get_run_status(self, run_id: int) -> RunStatus:
+            return next(statuses)
+
+    monkeypatch.setattr("dbops.core.runs.time.sleep", sleeps.append)
+    monkeypatch.setattr("dbops.core.runs.random.uniform", lambda lo, hi: 1.0)
+
+    assert wait_for_run(_Adapter(), 1, poll_interval=4, max_poll_interval=8) == (
+        RunStatus.SUCCESS
+    )
+    assert sleeps == [4, 6, 8]
+
+
+def test_wait_for_run_jitters_poll_interval(monkeypatch):
+    statuses = iter([RunStatus.RUNNING, RunStatus.RUNNING, RunStatus.SUCCESS])
+    sleeps: list[float] = []
+
+    class _Adapter:
+        def get_run_status(self, run_id: int) -> RunStatus:
+            return next(statuses)
+
+    monkeypatch.setattr("dbops.core.runs.time.sleep", sleeps.append)
+
+    wait_for_run(_Adapter(), 1, poll_interval=10, max_poll_interval=10)
+
+    assert len(sleeps) == 2
+    assert all(8 <= s <= 12 for s in sleeps)
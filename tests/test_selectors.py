@@ -31,3 +31,37 @@ def test_and_or_selectors():
 
     assert AndSelector([name_sel, tag_sel]).matches(job) is True
     assert OrSelector([name_sel, TagSelector("env", "dev")]).matches(job) is True
+
+
+def test_compiled_selectors_match_like_matches():
+    jobs = [
+        Job(id=1, name="daily-etl", tags={"env": "prod"}),
+        Job(id=2, name="daily-etl", tags={"env": "dev"}),
+        Job(id=3, name="weekly-etl", tags=None),
+    ]
+    selectors = [
+        NameRegexSelector("daily"),
+        TagSelector("env", "prod"),
+        AndSelector([NameRegexSelector("daily"), TagSelector("env", "dev")]),
+        OrSelector([NameRegexSelector("weekly"), TagSelector("env", "prod")]),
+    ]
+
+    for selector in selectors:
+        predicate = selector.compile()
+        assert [predicate(j) for j in jobs] == [selector.matches(j) for j in jobs]
+
+
+def test_and_selector_evaluates_cheaper_selectors_first():
+    name_sel = NameRegexSelector("daily")
+    tag_sel = TagSelector("env", "prod")
+
+    assert AndSelector([name_sel, tag_sel]).selectors == (tag_sel, name_sel)
+
+
+def test_or_selector_orders_children_and_nested_composites_by_cost():
+    name_sel = NameRegexSelector("daily")
+    tag_sel = TagSelector("env", "prod")
+    nested = AndSelector([NameRegexSelector("etl"), TagSelector("team", "data")])
+
+    assert OrSelector([name_sel, tag_sel]).selectors == (tag_sel, name_sel)
+    assert OrSelector([nested, name_sel]).selectors == (name_sel, nested)
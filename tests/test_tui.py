@@ -1,3 +1,4 @@
+from dbops.cli.common.labels import label_width
 from dbops.cli.tui import (
     _MAX_JOB_NAME_WIDTH,
     _job_choice_title,
@@ -37,3 +38,8 @@ def test_sort_jobs_for_display_is_alphabetical_case_insensitive():
 
     sorted_jobs = _sort_jobs_for_display(jobs)
     assert [job.name for job in sorted_jobs] == ["Alpha", "beta", "zeta"]
+
+
+def test_label_width_is_longest_name_or_zero():
+    assert label_width(["ab", "abcd", "a"]) == 4
+    assert label_width([]) == 0